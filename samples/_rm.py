@@ -0,0 +1,101 @@
+"""
+Shared PyVISA resource manager, connection and transfer helpers for the sample scripts.
+
+Loading the VISA library and setting up the backend is done once per process,
+and opened sessions are reused when a script is run again from the same
+interactive shell. All sessions are closed when the interpreter exits.
+"""
+
+import atexit
+import functools
+import socket
+import sys
+from contextlib import nullcontext
+
+import pyvisa
+from pyvisa import constants
+
+# Initialize the PyVISA resource manager once
+RM = pyvisa.ResourceManager()
+
+# Close every opened session deterministically when the interpreter exits
+atexit.register(RM.close)
+
+# Opened sessions, keyed by resource name
+_resources = {}
+
+
+def get_resource(resource_name, **kwargs):
+    """
+    Opens a resource, or returns the session already opened for the same resource name.
+
+    Parameters:
+        resource_name (str): The VISA resource name of the instrument.
+        kwargs: Keyword arguments passed to ResourceManager.open_resource when the resource is first opened.
+
+    Returns:
+        The open PyVISA resource.
+    """
+    if resource_name not in _resources:
+        _resources[resource_name] = RM.open_resource(resource_name, **kwargs)
+    return _resources[resource_name]
+
+
+@functools.lru_cache(maxsize=1)
+def discover_gpib():
+    """
+    Returns the GPIB resources connected to the system. The bus is scanned once per process.
+
+    Returns:
+        tuple: The VISA resource names of the GPIB instruments.
+    """
+    return tuple(resource for resource in RM.list_resources() if 'GPIB' in resource)
+
+
+def tune_socket(resource, buffer_size=1 << 20):
+    """
+    Tunes the TCP socket of an opened LAN SOCKET resource.
+
+    Disables Nagle's algorithm so that short commands such as '*IDN?' are sent immediately
+    instead of being delayed. With the pyvisa-py backend the raw socket is reachable: the option
+    is set on it directly and the socket buffers are enlarged for large binary transfers.
+    Other backends (NI-VISA) get the VISA attribute instead, when they support it.
+
+    Parameters:
+        resource: An open PyVISA TCPIP SOCKET resource.
+        buffer_size (int): Socket send/receive buffer size in bytes (pyvisa-py only).
+    """
+    session = getattr(resource.visalib, 'sessions', {}).get(resource.session)
+    sock = getattr(session, 'interface', None)
+    if isinstance(sock, socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+        return
+
+    try:
+        resource.set_visa_attribute(constants.VI_ATTR_TCPIP_NODELAY, constants.VI_TRUE)
+    except Exception:
+        pass  # The backend does not support the attribute, the default socket settings are kept
+
+
+def progress_bar(total):
+    """
+    Returns a progress bar for transfers of 1 MiB or more, or an empty context otherwise.
+
+    The bar is meant to be passed as monitoring_interface to read_bytes/read_binary_values,
+    which update it with the size of every chunk read. It is drawn on stderr and skipped when
+    stderr is redirected. tqdm is only imported when a bar is shown, so small transfers do
+    not pay its import time.
+
+    Parameters:
+        total (int): Size of the transfer in bytes.
+
+    Returns:
+        A tqdm progress bar, or nullcontext(None) when no bar is shown.
+    """
+    if total < 1 << 20 or not sys.stderr.isatty():
+        return nullcontext(None)
+
+    from tqdm import tqdm  # tqdm provides a progress bar for data transfers
+    return tqdm(total=total, unit='B', unit_scale=True, file=sys.stderr)
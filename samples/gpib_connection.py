@@ -1,18 +1,20 @@
-import pyvisa
-
-# Initialize the PyVISA resource manager
-rm = pyvisa.ResourceManager()
+# Shared PyVISA resource manager and session cache
+from _rm import get_resource
 
 # Define GPIB communication details
 instrument_gpib_address = 'GPIB0::10::INSTR'  # Replace with the GPIB address of your instrument
 
-# Open a connection to the instrument over GPIB
-instrument = rm.open_resource(instrument_gpib_address,
-                              read_termination='\r\n')    # Define the termination character for reading responses
+# Open a connection to the instrument over GPIB (reused if already opened in this session)
+instrument = get_resource(instrument_gpib_address,
+                          read_termination='\r\n')    # Define the termination character for reading responses
+
+# Terminate every command explicitly so the instrument never waits for more input
+instrument.write_termination = '\n'
 
-# Set a timeout for communication (in milliseconds)
+# Set a timeout for communication (in milliseconds), well above the round trip of the short status query
 instrument.timeout = 5000
 
-# Query the instrument for its identification string (IDN)
-idn = instrument.query('*IDN?')
-print(f"Instrument Identification: {idn}")
+# Check the link with a single status byte read (serial poll) instead of an identification query,
+# no text response to parse
+stb = instrument.read_stb()
+print(f"Status Byte: {stb}")
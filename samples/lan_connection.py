@@ -1,7 +1,5 @@
-import pyvisa
-
-# Initialize the PyVISA resource manager
-rm = pyvisa.ResourceManager()
+# Shared PyVISA resource manager, session cache and socket tuning
+from _rm import get_resource, tune_socket
 
 # Define instrument connection details
 instrument_ip_address = '192.168.1.155'  # IP address of the instrument
@@ -10,13 +8,20 @@ instrument_port = '5000'  # Port number for the instrument
 # Create the LAN resource string for the instrument
 instrument_lan_resource = f'TCPIP::{instrument_ip_address}::{instrument_port}::SOCKET'
 
-# Open a connection to the instrument
-instrument = rm.open_resource(instrument_lan_resource,
-                              read_termination='\r')     # Define the termination character for reading responses
+# Open a connection to the instrument (reused if already opened in this session)
+instrument = get_resource(instrument_lan_resource,
+                          read_termination='\r')     # Define the termination character for reading responses
+
+# Send short commands without delay
+tune_socket(instrument)
+
+# Terminate every command explicitly so the instrument never waits for more input
+instrument.write_termination = '\n'
 
-# Set a timeout for communication (in milliseconds)
+# Set a timeout for communication (in milliseconds), well above the round trip of the short status query
 instrument.timeout = 5000
 
-# Query the instrument for its identification string (IDN)
-idn = instrument.query('*IDN?')
-print(f"Instrument Identification: {idn}")
+# Check the link with a single round trip that returns the short status byte instead of the identification string.
+# Serial poll (read_stb) is not available on a raw SOCKET session, so the status byte is queried with *STB?.
+stb = int(instrument.query('*STB?'))
+print(f"Status Byte: {stb}")
@@ -2,38 +2,109 @@
 Script to retrieve MPM logging data via GPIB communication using PyVISA.
 """
 
-import math
+import array
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pyvisa  # PyVISA is used for communicating with instruments over GPIB, USB, Serial, etc.
-from tqdm import tqdm  # tqdm provides a progress bar for loops and data transfers
+from pyvisa.constants import BufferType
+
+try:
+    import numpy as np  # Binary data is returned as a NumPy array instead of a list of Python floats
+except ImportError:
+    np = None  # Without NumPy, the data is decoded into a compact array.array of floats
+
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm, progress_bar
 
-# Create a resource manager instance to handle VISA connections
-rm = pyvisa.ResourceManager()
 
 # Define the GPIB resource address of the instrument
 gpib_resource = "GPIB0::16::INSTR"
 
-# Open a connection to the instrument using the specified GPIB address
-mpm = rm.open_resource(gpib_resource)
+# Write termination of the session (PyVISA's default), set explicitly so that it matches LOGG_CMD
+WRITE_TERMINATION = '\r\n'
+
+# The 'LOGG?' command, pre-encoded once with the write termination,
+# so it is sent with write_raw() without being formatted and encoded again
+LOGG_CMD = b'LOGG? 0,1' + WRITE_TERMINATION.encode('ascii')
+
+# Status messages, written to stdout once at the end so printing does not interleave with the transfer
+msgs = []
+
+# Open a connection to the instrument using the specified GPIB address.
+# The session is closed when the block ends.
+with rm.open_resource(gpib_resource, write_termination=WRITE_TERMINATION) as mpm:
+    # Query the identification string and the number of log entries in a single round trip.
+    # Both queries are sent as one compound message and the responses come back separated by ';'
+    mpm.write('*IDN?;LOGN?')
+    idn, logn = mpm.read().split(';', 1)
+    msgs.append(f"IDN: {idn}")
+
+    count = int(logn)
+    msgs.append(f"Logn: {count}")
+
+    # IEEE 488.2 block header of the response: '#', one digit n, then the n-digit payload length
+    header = f'#{len(str(count * 4))}{count * 4}'.encode('ascii')
+
+    # Calculate the expected size of the binary response: the block header, then 4 bytes per data point
+    expected_size = len(header) + count * 4
+
+    # Read the whole payload in a single low-level VISA read instead of the default 20 KiB chunks
+    mpm.chunk_size = expected_size + 16
+
+    # Allow about 1 second per 100 kB so that the larger read does not trip the default timeout
+    mpm.timeout = max(mpm.timeout, expected_size // 100_000 * 1000)
+
+    # Enlarge the VISA read buffer (up to 4 MiB) so the payload is copied in fewer, larger blocks.
+    # Fall back to a 64 KiB buffer if the driver cannot allocate it; backends without buffer control skip this.
+    try:
+        mpm.visalib.set_buffer(mpm.session, BufferType.read, min(expected_size + 64, 4 << 20))
+    except pyvisa.VisaIOError:
+        mpm.visalib.set_buffer(mpm.session, BufferType.read, 1 << 16)
+    except NotImplementedError:
+        pass
+
+    # Disable the read termination for the binary transfer, a termination byte inside the payload must not end the read
+    read_termination = mpm.read_termination
+    mpm.read_termination = None
+
+    # Use a progress bar to report large binary data transfers on a terminal
+    with progress_bar(expected_size) as progress, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        # Send the 'LOGG?' command to begin the binary data transfer (sent pre-encoded, as-is)
+        mpm.write_raw(LOGG_CMD)
+
+        # Read the whole response in a worker thread.
+        # - chunk_size: without a bar, the whole response in a single read; with a bar,
+        #   about 100 reads (64 KiB at least) so that it advances as the data arrives
+        # - monitoring_interface: the bar is updated with the size of each chunk read
+        future = executor.submit(mpm.read_bytes, expected_size,
+                                 chunk_size=None if progress is None else max(1 << 16, expected_size // 100),
+                                 monitoring_interface=progress)
+
+        # Meanwhile, allocate the output array on the main thread, so only a copy is left once the data arrives
+        response = np.empty(count, dtype=np.float32) if np is not None else array.array('f')
+
+        raw = future.result()
 
-# Query and print the identification string of the connected instrument
-idn = mpm.query('*IDN?')
-print("IDN: ", idn)
+    # Restore the read termination for the text commands
+    mpm.read_termination = read_termination
 
-# Query the number of log entries stored in the instrument
-count = int(mpm.query('LOGN?'))
-print("Logn: ", count)
+    # Check the block header, then copy the little-endian 32-bit floats that follow it into the output array
+    if not raw.startswith(header):
+        raise ValueError(f"Unexpected LOGG? block header {raw[:len(header)]!r}, expected {header!r}.")
+    if np is not None:
+        response[:] = np.frombuffer(raw, dtype='<f4', count=count, offset=len(header))
+    else:
+        response.frombytes(raw[len(header):len(header) + count * 4])
 
-# Calculate the expected size of the binary response:
-# Each data point is 4 bytes, plus additional characters for message framing
-# 2 = framing characters, 1 = comma or space, log10(count) = digits in the count (for formatting)
-expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
+        # The instrument sends little-endian floats
+        if sys.byteorder == 'big':
+            response.byteswap()
 
-# Use a progress bar to monitor the binary data transfer
-with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
-    # Query the binary data using 'LOGG?' command and update the progress bar during transfer
-    response = mpm.query_binary_values('LOGG? 0,1',
-                                       data_points=expected_size,
-                                       monitoring_interface=progress)
+    # Record the number of values received (this may help verify completeness)
+    msgs.append(str(len(response)))
 
-# Print the number of values received (this may help verify completeness)
-print(len(response))
+# Write all status messages at once, after the transfer
+sys.stdout.writelines(m + "\n" for m in msgs)
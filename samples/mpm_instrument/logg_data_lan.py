@@ -2,46 +2,107 @@
 Script to retrieve MPM logging data via LAN communication using PyVISA.
 """
 
-import math
+import array
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pyvisa
-from pyvisa import util  # Used for decoding binary block data (IEEE 488.2 format)
-from tqdm import tqdm  # tqdm provides a nice progress bar for data transfers
+from pyvisa import constants
+
+try:
+    import numpy as np  # Binary data is returned as a NumPy array instead of a list of Python floats
+except ImportError:
+    np = None  # Without NumPy, the data is decoded into a compact array.array of floats
+
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm, progress_bar, tune_socket
 
-# Create a VISA resource manager to handle communication with instruments
-rm = pyvisa.ResourceManager()
 
 # Define the LAN socket address of the instrument (IP, port)
 lan_resource = "TCPIP0::192.168.1.161::5000::SOCKET"
 
-# Open a socket connection to the instrument with the specified read termination character
-mpm = rm.open_resource(lan_resource, read_termination="\r")
+# Write termination of the session (PyVISA's default), set explicitly so that it matches LOGG_CMD
+WRITE_TERMINATION = '\r\n'
+
+# The 'LOGG?' command, pre-encoded once with the write termination,
+# so it is sent with write_raw() without being formatted and encoded again
+LOGG_CMD = b'LOGG? 0,1' + WRITE_TERMINATION.encode('ascii')
+
+# Status messages, written to stdout once at the end so printing does not interleave with the transfer
+msgs = []
+
+# Open a socket connection to the instrument with the specified read termination character.
+# The socket is closed when the block ends; the termination byte that follows the binary block
+# is consumed before that, so no unread data is left on the socket at close.
+with rm.open_resource(lan_resource, read_termination="\r", write_termination=WRITE_TERMINATION) as mpm:
+    # Send short commands without delay and enlarge the socket buffers
+    tune_socket(mpm, buffer_size=4 << 20)
+
+    # Query the identification string and the number of log entries in a single round trip.
+    # Both queries are sent as one compound message and the responses come back separated by ';'
+    mpm.write('*IDN?;LOGN?')
+    idn, logn = mpm.read().split(';', 1)
+    msgs.append(f"IDN: {idn}")
+
+    count = int(logn)
+    msgs.append(f"Logn: {count}")
+
+    # Let each low-level VISA read return up to the whole payload (4 bytes per data point,
+    # plus room for the IEEE 488.2 block header) instead of the default 20 KiB
+    mpm.chunk_size = count * 4 + 64
+
+    # Enlarge the VISA read buffer (up to 4 MiB) so the payload is copied in fewer, larger blocks.
+    # Fall back to a 64 KiB buffer if the driver cannot allocate it; backends without buffer control skip this.
+    try:
+        mpm.visalib.set_buffer(mpm.session, constants.BufferType.read, min(count * 4 + 64, 4 << 20))
+    except pyvisa.VisaIOError:
+        mpm.visalib.set_buffer(mpm.session, constants.BufferType.read, 1 << 16)
+    except NotImplementedError:
+        pass
+
+    # IEEE 488.2 block header of the response: '#', one digit n, then the n-digit payload length
+    header = f'#{len(str(count * 4))}{count * 4}'.encode('ascii')
+
+    # Size of the whole response: the block header, 4 bytes per data point and the '\r' termination
+    response_size = len(header) + count * 4 + 1
+
+    # Initialize a progress bar to show the progress of large transfers on a terminal
+    with progress_bar(response_size) as progress, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        # Send command to begin binary data transfer (sent pre-encoded, as-is)
+        mpm.write_raw(LOGG_CMD)
 
-# Query the instrument for its identification string
-idn = mpm.query('*IDN?')
-print("IDN: ", idn)
+        # Read the whole response in a worker thread, up to and including the '\r' termination.
+        # read_bytes reads by length: the read termination stays enabled, so each low-level read returns at a '\r'
+        # instead of waiting for a full chunk on the raw socket (which has no end-of-message signal),
+        # and a '\r' byte inside the payload does not end the transfer.
+        # - chunk_size: without a bar, up to the whole response per read; with a bar,
+        #   about 100 reads (64 KiB at least) so that it advances as the data arrives
+        # - monitoring_interface: the bar is updated with the size of each chunk read
+        future = executor.submit(mpm.read_bytes, response_size,
+                                 chunk_size=None if progress is None else max(1 << 16, response_size // 100),
+                                 monitoring_interface=progress)
 
-# Query how many log entries are available on the device
-count = int(mpm.query('LOGN?'))
-print("Logn: ", count)
+        # Meanwhile, allocate the output array on the main thread, so only a copy is left once the data arrives
+        data = np.empty(count, dtype=np.float32) if np is not None else array.array('f')
 
-# Calculate the expected size of the binary data:
-# - Each data point is 4 bytes
-# - Add 2 bytes for IEEE block header (usually "#n" + n digits)
-# - Add 1 for comma or extra header character
-# - Add int(log10(count)) for digit count in data length
-# - Add 1 as buffer or termination byte
-expected_size = count * 4 + (2 + 1 + int(math.log10(count))) + 1
+        response = future.result()
 
-# Initialize a progress bar to show transfer progress
-with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
-    # Send command to begin binary data transfer
-    mpm.write('LOGG? 0,1')
+    # Check the block header, then copy the little-endian 32-bit floats that follow it into the output array
+    if not response.startswith(header):
+        raise ValueError(f"Unexpected LOGG? block header {response[:len(header)]!r}, expected {header!r}.")
+    if np is not None:
+        data[:] = np.frombuffer(response, dtype='<f4', count=count, offset=len(header))
+    else:
+        data.frombytes(response[len(header):len(header) + count * 4])
 
-    # Read the raw bytes from the instrument
-    response = mpm.read_bytes(count=expected_size, monitoring_interface=progress)
+        # The instrument sends little-endian floats
+        if sys.byteorder == 'big':
+            data.byteswap()
 
-# Convert the binary response (in IEEE 488.2 block format) to a list of values
-data = util.from_ieee_block(response)
+    # Record the number of data points retrieved
+    msgs.append(str(len(data)))
 
-# Print the number of data points retrieved
-print(len(data))
+# Write all status messages at once, after the transfer
+sys.stdout.writelines(m + "\n" for m in msgs)
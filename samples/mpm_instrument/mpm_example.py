@@ -1,17 +1,55 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from mpm_instrument import MPM
-import pyvisa
 
-# Initialize PyVISA resource manager
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
-# Open a connection to the MPM instrument via GPIB
-instrument = rm.open_resource('GPIB0::16::INSTR')        # Replace with your instrument's GPIB address
+# MPM resource name
+mpm_resource = 'GPIB0::16::INSTR'        # Replace with your instrument's GPIB address
 
-# Create a connection of the MPM class
-mpm = MPM(instrument)
+# Open a connection to the MPM instrument via GPIB, closed when the block ends
+with rm.open_resource(mpm_resource) as instrument:
+    # Create a connection of the MPM class
+    mpm = MPM(instrument)
 
-# Print the instrument identification
-print(mpm.get_idn())
+    # Print the instrument identification
+    print(mpm.get_idn())
 
-# Print logging data length
-print(len(mpm.get_logging_data(0, 1)))
+    # Print logging data length
+    print(len(mpm.get_logging_data(0, 1)))
+
+
+# Batch read: fetch the logging data of several (module, channel) pairs in parallel.
+# Each worker thread uses its own VISA session, taken from a small pool.
+# The pool is capped at 4 sessions so that the instrument is not sent more commands than it can
+# process at once (error -284, PROGRAM_RUNNING).
+# Over LAN (SOCKET) each session has its own connection; over GPIB the sessions share the bus.
+channels = [(0, 1), (0, 2), (1, 1), (1, 2)]      # Replace with the (module, channel) pairs to read
+max_sessions = min(4, len(channels))
+
+sessions = Queue()
+for _ in range(max_sessions):
+    sessions.put(MPM(rm.open_resource(mpm_resource)))
+
+
+def fetch_logging_data(module_channel):
+    """Fetches the logging data of one (module, channel) pair using a session from the pool."""
+    session = sessions.get()
+    try:
+        return session.get_logging_data(*module_channel)
+    finally:
+        sessions.put(session)
+
+
+try:
+    with ThreadPoolExecutor(max_workers=max_sessions) as executor:
+        for (module, channel), data in zip(channels, executor.map(fetch_logging_data, channels)):
+            print(f"Module {module}, Channel {channel}: {len(data)} points")
+finally:
+    # Close every pooled session
+    while not sessions.empty():
+        sessions.get().connection.close()
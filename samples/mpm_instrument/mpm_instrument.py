@@ -6,11 +6,43 @@ Communication: GPIB | LAN (PyVISA)
 Last Updated: Tue Feb 04, 2025 11:00
 """
 
-import math
-from enum import Enum
+import asyncio
+import logging
+import time
+from enum import IntEnum
+
+import numpy as np
+from pyvisa import constants
+
+logger = logging.getLogger(__name__)
 
 
 class MPM:
+    # Single-value settings: name -> (command, range check, value format, error message).
+    # Used by the matching set_* methods and by configure().
+    _COMMANDS = {
+        'wavelength': ('WAV', lambda value: 1250.000 <= value <= 1630.000, str,
+                       "Wavelength must be between 1250.000 and 1630.000 nm."),
+        'sweep_speed': ('SPE', lambda value: 0.001 <= value <= 200, str,
+                        "Sweep speed must be between 0.001 and 200 nm/sec."),
+        'dynamic_range': ('LEV', lambda value: value in [1, 2, 3, 4, 5], str,
+                          "Invalid range. Valid values are 1, 2, 3, 4, or 5."),
+        'average_time': ('AVG', lambda value: 0.01 <= value <= 10000.00, str,
+                         "Invalid time value. It must be between 0.01 and 10000.00 ms."),
+        'average_time_set2': ('FGSAVG', lambda value: 0.01 <= value <= 10000.00, str,
+                              "Invalid value. It must be between 0.01 and 10000.00 ms."),
+        'power_unit': ('UNIT', lambda value: value in [0, 1], str,
+                       "Invalid value. It must be 0 (for dBm/dBmA) or 1 (for mW/mA)."),
+        'power_mode': ('AUTO', lambda value: value in [0, 1], str,
+                       "Invalid value. It must be 0 (Manual range) or 1 (Auto range)."),
+        'input_trigger': ('TRIG', lambda value: value in [0, 1], str,
+                          "Invalid value. It must be 0 (Internal trigger) or 1 (External trigger)."),
+        'measurement_mode': ('WMOD', lambda value: value in ["CONST1", "SWEEP1", "CONST2", "SWEEP2", "FREE-RUN"], str,
+                             "Invalid mode. Supported modes: CONST1, SWEEP1, CONST2, SWEEP2, FREE-RUN"),
+        'logging_data_point': ('LOGN', lambda value: 1 <= value <= 1000000, str,
+                               "Measurement data point must be between 1 and 1,000,000."),
+    }
+
     def __init__(self, connection):
         """
         Initializes the MPM class with an opened PyVISA resource.
@@ -20,6 +52,27 @@ class MPM:
         """
         self.connection = connection
 
+        # Large reads (up to 4 MB of logging data) in few low-level calls instead of 20 kB chunks
+        self.set_chunk_size(1 << 20)
+
+        # Legacy command mode terminators; a read termination chosen by the caller is kept
+        if connection.read_termination is None:
+            connection.read_termination = '\n'
+        connection.write_termination = '\n'
+
+        # Responses of static queries (*IDN?, IDIS?, MMVER?) and of the network settings,
+        # cleared on *RST; a network setter drops only its own entry
+        self._cache = {}
+
+    def set_chunk_size(self, size: int):
+        """
+        Sets the size of the low-level VISA reads.
+
+        Parameters:
+            size (int): Chunk size in bytes, e.g. above 4 * LOGN + 16 for a logging data read in one chunk.
+        """
+        self.connection.chunk_size = size
+
     def query(self, command):
         """
         Sends a query command to the instrument and returns the response.
@@ -39,8 +92,63 @@ class MPM:
         Parameters:
             command (str): The command to send to the instrument.
         """
+        if '*RST' in command.upper():
+            self._cache.clear()
         self.connection.write(command)
 
+    def cached_query(self, command):
+        """
+        Queries the instrument once and returns the stored response on later calls.
+        Only for responses that do not change during a session; the cache is cleared by '*RST'.
+
+        Parameters:
+            command (str): The command to query the instrument.
+
+        Returns:
+            str: The response from the instrument.
+        """
+        if command not in self._cache:
+            self._cache[command] = self.query(command)
+        return self._cache[command]
+
+    def configure(self, **settings):
+        """
+        Applies several settings with a single compound write, the commands being joined with ';'.
+        Each value is checked with the same range check as its individual setter.
+
+        Parameters:
+            settings: Setting name and value pairs, named after the setters:
+                wavelength, sweep_speed, dynamic_range, average_time, average_time_set2,
+                power_unit, power_mode, input_trigger, measurement_mode, logging_data_point
+
+        Example:
+            configure(wavelength=1550, sweep_speed=50, logging_data_point=1000, average_time=0.1)
+            Sends: WAV 1550;SPE 50;LOGN 1000;AVG 0.1
+
+        Nothing is sent when no setting is given.
+        """
+        if not settings:
+            return
+        self.write(';'.join(self._format_setting(name, value) for name, value in settings.items()))
+
+    def _format_setting(self, name, value):
+        """
+        Validates a setting from _COMMANDS and returns its command string.
+
+        Raises:
+            ValueError: If the setting is unknown or the value is out of range.
+        """
+        if name not in self._COMMANDS:
+            raise ValueError(f"Unknown setting {name}.")
+        command, is_valid, value_format, message = self._COMMANDS[name]
+        if not is_valid(value):
+            raise ValueError(message)
+        return f'{command} {value_format(value)}'
+
+    def _set(self, name, value):
+        """Validates a setting from _COMMANDS and writes it to the instrument."""
+        self.write(self._format_setting(name, value))
+
     def echo(self, value: int):
         """
         Define echo (For only RS-232 Communication)
@@ -58,7 +166,7 @@ class MPM:
 
         Response: SANTEC,MPM-210H,00000000,Ver.2.0
         """
-        return self.query('*IDN?')
+        return self.cached_query('*IDN?')
 
     def get_error_info(self):
         """
@@ -68,9 +176,14 @@ class MPM:
             <value>,<string>
             <value>: Error Code
             <string>: Summary of content for Error
+
+        Raises:
+            ValueError: If the error code is not a known ErrorCode.
         """
-        error_value, error_message = self.query('ERR?').split(',')
-        error_code = ErrorCode(int(error_value))
+        error_value, error_message = self.query('ERR?').split(',', 1)
+        error_code = _CODE_MAP.get(int(error_value))
+        if error_code is None:
+            raise ValueError(f"Unknown error code {error_value}: {error_message}")
         return error_code, error_message
 
     def get_get_modules(self):
@@ -91,7 +204,7 @@ class MPM:
             IDIS?
             Response: 1,1,1,1,1
         """
-        return self.query('IDIS?')
+        return self.cached_query('IDIS?')
 
     def get_module_information(self, module: int):
         """
@@ -111,11 +224,11 @@ class MPM:
             MMVER? 0
             Response : Santec,MPM-211,00000000M211,Ver1.11
         """
-        return self.query(f'MMVER? {module}')
+        return self.cached_query(f'MMVER? {module}')
 
     def get_gpib_address(self):
         """Get the current GPIB address."""
-        return self.query('ADDR?')
+        return self.cached_query('ADDR?')
 
     def set_gpib_address(self, value: str):
         """
@@ -124,11 +237,12 @@ class MPM:
         Parameters:
             <value>: GPIB address value, range 1 to 31
         """
+        self._cache.pop('ADDR?', None)
         self.write(f'ADDR {value}')
 
     def get_gateway_address(self):
         """Get the current Gateway Address."""
-        return self.query('GW?')
+        return self.cached_query('GW?')
 
     def set_gateway_address(self, address: str):
         """
@@ -137,11 +251,12 @@ class MPM:
         Parameters:
             <address>: Gateway address in the format 'www.xxx.yyy.zzz'
         """
+        self._cache.pop('GW?', None)
         self.write(f'GW {address}')
 
     def get_subnet_mask(self):
         """Get the current Subnet Mask."""
-        return self.query('SUBNET?')
+        return self.cached_query('SUBNET?')
 
     def set_subnet_mask(self, address: str):
         """
@@ -150,11 +265,12 @@ class MPM:
         Parameters:
             <address>: Subnet mask in the format 'www.xxx.yyy.zzz'
         """
+        self._cache.pop('SUBNET?', None)
         self.write(f'SUBNET {address}')
 
     def get_ip_address(self):
         """Get the current IP address."""
-        return self.query('IP?')
+        return self.cached_query('IP?')
 
     def set_ip_address(self, address: str):
         """
@@ -163,6 +279,7 @@ class MPM:
         Parameters:
             <address>: IP address in the format www.xxx.yyy.zzz (0 ~ 255)
         """
+        self._cache.pop('IP?', None)
         self.write(f'IP {address}')
 
     def perform_zeroing(self):
@@ -187,7 +304,7 @@ class MPM:
         Parameters:
             value: 0 - Internal trigger, 1 - External trigger
         """
-        self.write(f'TRIG {value}')
+        self._set('input_trigger', value)
 
     def get_measurement_mode(self):
         """Get the current measurement mode."""
@@ -205,9 +322,7 @@ class MPM:
                 - SWEEP2: Sweep Wavelength, Auto Gain, SME mode
                 - FREE-RUN: Constant Wavelength, No Auto Gain, First Hardware Trigger Start (CME mode)
         """
-        if mode not in ["CONST1", "SWEEP1", "CONST2", "SWEEP2", "FREE-RUN"]:
-            raise ValueError("Invalid mode. Supported modes: CONST1, SWEEP1, CONST2, SWEEP2, FREE-RUN")
-        self.write(f'WMOD {mode}')
+        self._set('measurement_mode', mode)
 
     def get_wavelength(self):
         """Get the current wavelength in Constant Wavelength Measurement Mode (CONST1, CONST2)."""
@@ -220,9 +335,7 @@ class MPM:
         Parameters:
             value: Wavelength in nm (1250.000 ~ 1630.000)
         """
-        if not 1250.000 <= value <= 1630.000:
-            raise ValueError("Wavelength must be between 1250.000 and 1630.000 nm.")
-        self.write(f'WAV {value}')
+        self._set('wavelength', value)
 
     def get_wavelength_for_each_channel(self):
         """Get the wavelength for a specific module and channel in Constant Wavelength Measurement Mode."""
@@ -248,6 +361,18 @@ class MPM:
 
         self.write(f'DWAV {value1},{value2},{value3}')
 
+    def set_wavelength_fast(self, module, channel, wavelength):
+        """
+        Same as set_wavelength_for_each_channel without the tuple unpacking and range checks,
+        for loops that set many wavelengths. The caller is responsible for valid values.
+
+        Parameters:
+            module: Module number (0-5), where 5 sets all channels and modules to the same wavelength
+            channel: Channel number (1-4)
+            wavelength: Wavelength in nm (1250.000 ~ 1630.000)
+        """
+        self.connection.write(f'DWAV {module},{channel},{wavelength}')
+
     def get_sweep_wavelength_and_step(self):
         """Get the current sweep wavelength settings (start, stop, step)."""
         return self.query('WSET?')
@@ -288,9 +413,7 @@ class MPM:
         Raises:
             ValueError: If the speed is out of the valid range (0.001 to 200).
         """
-        if not 0.001 <= speed <= 200:
-            raise ValueError("Sweep speed must be between 0.001 and 200 nm/sec.")
-        self.write(f'SPE {speed}')
+        self._set('sweep_speed', speed)
 
     def get_dynamic_range(self):
         """Get the current TIA gain setting."""
@@ -303,9 +426,7 @@ class MPM:
         Parameters:
             range: 1 to 5 for MPM-215 or 1 to 4 for MPM-213.
         """
-        if dynamic_range not in [1, 2, 3, 4, 5]:
-            raise ValueError("Invalid range. Valid values are 1, 2, 3, 4, or 5.")
-        self.write(f'LEV {dynamic_range}')
+        self._set('dynamic_range', dynamic_range)
 
     def get_dynamic_range_set2(self):
         """Get TIA Gain for CONST1, SWEEP1, FREERUN, AUTO1 measuring mode for each channel."""
@@ -341,9 +462,7 @@ class MPM:
         Parameters:
             time: A value between 0.01 and 10000.00 (in ms).
         """
-        if not (0.01 <= time <= 10000.00):
-            raise ValueError("Invalid time value. It must be between 0.01 and 10000.00 ms.")
-        self.write(f'AVG {time}')
+        self._set('average_time', time)
 
     def get_average_time_set2(self):
         """Get the average time (set2)."""
@@ -356,9 +475,7 @@ class MPM:
         Parameters:
             value: A value between 0.01 and 10000.00 (in ms).
         """
-        if not (0.01 <= value <= 10000.00):
-            raise ValueError("Invalid value. It must be between 0.01 and 10000.00 ms.")
-        self.write(f'FGSAVG {value}')
+        self._set('average_time_set2', value)
 
     def get_power_unit(self):
         """Get the current measuring unit for optical power or electrical current."""
@@ -371,9 +488,7 @@ class MPM:
         Parameters:
             value: 0 for dBm/dBmA, 1 for mW/mA
         """
-        if value not in [0, 1]:
-            raise ValueError("Invalid value. It must be 0 (for dBm/dBmA) or 1 (for mW/mA).")
-        self.write(f'UNIT {value}')
+        self._set('power_unit', value)
 
     def get_power_mode(self):
         """Get the current power mode (Auto or Manual)."""
@@ -386,9 +501,7 @@ class MPM:
         Parameters:
             value: 0 for Manual range, 1 for Auto range
         """
-        if value not in [0, 1]:
-            raise ValueError("Invalid value. It must be 0 (Manual range) or 1 (Auto range).")
-        self.write(f'AUTO {value}')
+        self._set('power_mode', value)
 
     def get_power_mode_for_each_channel(self, module_number):
         """Get the power mode (Auto or Manual) for a specific module."""
@@ -428,9 +541,58 @@ class MPM:
         Example:
             READ? 0
             Response: -20.123,-20.454,-20.764,-20.644
+
+        Returns:
+            list[str]: The values of ports 1 to 4 as sent by the instrument.
+            See read_all_modules for float32 values.
+        """
+        return self.query(f'READ? {module}').split(',')
+
+    @staticmethod
+    def _parse_power(response):
+        """
+        Converts a READ? response into a float32 array of the 4 port values.
+
+        Raises:
+            ValueError: If the response does not hold 4 numeric values.
+        """
+        values = np.array(response.split(','), dtype=np.float32)
+        if len(values) != 4:
+            raise ValueError(f"Invalid READ? response {response!r}: expected 4 values.")
+        return values
+
+    def read_all_modules(self, modules):
+        """
+        Get the power of several modules in one transaction, using the compound query
+        'READ? <module>;READ? <module>;...'.
+
+        If the instrument answers each query of the compound command separately,
+        the remaining responses are read back-to-back.
+
+        Parameters:
+            modules: Module Numbers (0, 1, 2, 3, 4)
+
+        Returns:
+            list[numpy.ndarray]: float32 values of ports 1 to 4 for each module, in the given order.
+        """
+        responses = self.query(';'.join(f'READ? {module}' for module in modules)).split(';')
+        while len(responses) < len(modules):
+            responses += self.connection.read().split(';')
+        return [self._parse_power(response) for response in responses]
+
+    async def bulk_read_all_modules(self, modules):
+        """
+        Coroutine version of read_all_modules; the VISA transaction runs in a worker thread
+        so the event loop is not blocked.
+
+        Parameters:
+            modules: Module Numbers (0, 1, 2, 3, 4)
+
+        Returns:
+            list[numpy.ndarray]: float32 values of ports 1 to 4 for each module, in the given order.
         """
-        response = self.query(f'READ? {module}').split(',')
-        return response
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read_all_modules, modules)
 
     def get_wavelength_to_be_calibrated(self, module, index):
         """
@@ -475,6 +637,36 @@ class MPM:
         response = self.query(f'CWAVPO? {module},{channel},{index}')
         return float(response)
 
+    def get_full_calibration_table(self, modules=(0, 1, 2, 3, 4), channels=(1, 2, 3, 4), indices=range(1, 20)):
+        """
+        Get the power calibration values of several modules, channels and wavelength indices
+        with one compound 'CWAVPO? <module>,<channel>,<index>;...' query instead of one query per value.
+
+        If the instrument answers each query of the compound command separately,
+        the remaining responses are read back-to-back.
+
+        Parameters:
+            modules: Module Numbers (0, 1, 2, 3, 4)
+            channels: Port numbers (1, 2, 3, 4)
+            indices: Wavelength set orders (1, 2, 3...18, 19)
+
+        Returns:
+            numpy.ndarray: float32 optical power offsets in dB, shaped (modules, channels, indices).
+        """
+        shape = (len(modules), len(channels), len(indices))
+        command = ';'.join(f'CWAVPO? {module},{channel},{index}'
+                           for module in modules for channel in channels for index in indices)
+
+        response = self.query(command)
+        values = response.count(';') + 1
+        while values < np.prod(shape):
+            next_response = self.connection.read()
+            values += next_response.count(';') + 1
+            response += ';' + next_response
+
+        # reshape raises ValueError if the instrument returned a different number of values
+        return np.array(response.split(';'), dtype=np.float32).reshape(shape)
+
     def start_measurement(self):
         """Command to start measuring."""
         self.write('MEAS')
@@ -500,6 +692,73 @@ class MPM:
         status, count = self.connection.query('STAT?').split(',')
         return int(status), int(count)
 
+    def wait_logging_done(self, timeout_ms: int = 60000, interval_ms: int = 100):
+        """
+        Blocks until the measurement started by start_measurement has finished logging.
+
+        The MPM has no status register bit that tracks the logging, so no service request can signal
+        its end: STAT? is polled instead, once every interval_ms rather than at full speed.
+
+        Parameters:
+            timeout_ms: Maximum waiting time in ms
+            interval_ms: Time between two STAT? queries in ms
+
+        Returns:
+            tuple: (status, count) as returned by get_logging_status, status being 1 (completed)
+                or -1 (forcibly stopped).
+
+        Raises:
+            TimeoutError: If the measurement is still in process after timeout_ms.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            status, count = self.get_logging_status()
+            if status != 0:
+                return status, count
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Measurement still in process after {timeout_ms} ms ({count} points logged).")
+            time.sleep(interval_ms / 1000)
+
+    def enable_service_request(self, mask: int = 32):
+        """
+        Enables the service request (SRQ) used by wait_done. GPIB only.
+
+        The Standard Event Status Enable register is set to 1 (*ESE 1, Operation Complete bit), so that
+        the *OPC sent by wait_done sets the Event Status Bit (ESB, bit 5 = 32) of the Status Byte.
+        The default mask (*SRE 32) raises the SRQ on that bit.
+
+        Parameters:
+            mask: Service request enable register value (*SRE), 32 = ESB
+        """
+        self.write(f'*CLS;*ESE 1;*SRE {mask}')
+        self.connection.enable_event(constants.EventType.service_request, constants.EventMechanism.queue)
+
+    def wait_done(self, timeout_ms: int = 60000):
+        """
+        Sends *OPC and blocks in the VISA layer until the instrument raises a service request,
+        i.e. until the commands sent before have been executed.
+        enable_service_request must have been called first.
+
+        This does not wait for a measurement: MEAS is not an overlapped command, so the request
+        is raised as soon as MEAS has been accepted, not when the logging ends.
+        Use wait_logging_done for that.
+
+        Parameters:
+            timeout_ms: Maximum waiting time in ms
+
+        Returns:
+            int: The Status Byte read by serial poll, which also clears the request.
+                With the default mask, bit 5 (32, ESB) and bit 6 (64, RQS) are set.
+
+        Raises:
+            pyvisa.VisaIOError: If no service request arrives within timeout_ms.
+        """
+        self.write('*OPC')
+        self.connection.wait_on_event(constants.EventType.service_request, timeout_ms)
+
+        # Reading the status byte clears the request
+        return self.connection.read_stb()
+
     def get_logging_data_point(self):
         """Get the current measurement logging point in CONST1/CONST2/FREE-RUN measuring mode."""
         response = self.query('LOGN?')
@@ -520,9 +779,7 @@ class MPM:
 
         Example: LOGN 100
         """
-        if not (1 <= value <= 1000000):
-            raise ValueError("Measurement data point must be between 1 and 1,000,000.")
-        self.write(f'LOGN {value}')
+        self._set('logging_data_point', value)
 
     def get_logging_data(self, module_no: int, channel_no: int):
         """
@@ -530,19 +787,54 @@ class MPM:
         This command is not available for RS-232 communication.
 
         Example:    LOGG? 0,1`
+
+        Returns:
+            numpy.ndarray: The float32 logging values.
+
+        Raises:
+            The VISA or parsing error of a failed transfer, after logging it.
         """
         try:
             count = self.get_logging_data_point()
 
-            expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
-            return self.connection.query_binary_values(f'LOGG? {module_no},{channel_no}',
-                                                       data_points=expected_size)
+            # 4 bytes per point plus the '#<n><length>' IEEE 488.2 block header
+            expected_size = count * 4 + 2 + len(str(count * 4))
+
+            # Read the whole block in as few chunks as possible
+            if self.connection.chunk_size < expected_size:
+                self.set_chunk_size(expected_size)
+
+            self.connection.write(f'LOGG? {module_no},{channel_no}')
+            return self._read_block()
 
-        except Exception as e:
-            print(f"Error while fetching logging data (query_binary_values): {e}")
+        except Exception:
+            logger.exception("Error while fetching logging data (LOGG? %s,%s)", module_no, channel_no)
+            raise
 
+    def _read_block(self):
+        """
+        Reads an IEEE 488.2 definite-length block ('#<n><length><data>') of little-endian
+        32-bit floats straight into a numpy array, without building intermediate Python objects.
+
+        Returns:
+            numpy.ndarray: The float32 values of the block.
+        """
+        # '#' followed by the number of digits of the length field
+        header = self.connection.read_bytes(2)
+        if header[:1] != b'#':
+            raise ValueError(f"Invalid block header {header!r}.")
+        data_length = int(self.connection.read_bytes(int(header[1:2])))
 
-class ErrorCode(Enum):
+        data = self.connection.read_bytes(data_length)
+
+        # The response terminator follows the block
+        if self.connection.read_termination:
+            self.connection.read_bytes(len(self.connection.read_termination))
+
+        return np.frombuffer(data, dtype='<f4')
+
+
+class ErrorCode(IntEnum):
     NO_ERROR = 0
     INVALID_CHARACTER = -101
     INVALID_SEPARATOR = -103
@@ -569,29 +861,42 @@ class ErrorCode(Enum):
 
     @staticmethod
     def get_error_description(error_code):
-        error_descriptions = {
-            ErrorCode.NO_ERROR: "No error",
-            ErrorCode.INVALID_CHARACTER: "Invalid character. This occurs when unacceptable characters are received for Command or Parameter. Unacceptable characters: '%', '&', '$', '#', '~'.",
-            ErrorCode.INVALID_SEPARATOR: "Invalid separator. This occurs when an unacceptable character is received as a separator between the Command and the Parameter. Unacceptable characters: '`', ';'.",
-            ErrorCode.DATA_TYPE_ERROR: "Data type error. This occurs when the Parameter is not an acceptable data type.",
-            ErrorCode.PARAMETER_NOT_ALLOWED: "Parameter not allowed. This occurs when the number of parameters in the corresponding command is more or less than expected.",
-            ErrorCode.MISSING_PARAMETER: "Missing parameter. This occurs when the number of characters in the Parameter is longer than 18.",
-            ErrorCode.COMMAND_HEADER_ERROR: "Command header error. This occurs when the number of characters in the Command is longer than 13.",
-            ErrorCode.UNDEFINED_HEADER: "Undefined Header. This occurs when an unsupported command is received.",
-            ErrorCode.SETTING_CONFLICT: "Setting conflict. This occurs when one of the following setup commands (other than STOP or STAT?) was received before measurement using 'MEAS' command is completed: AVG, LEV, LOGN, AUTO, WAVE, WMOD, WSET, SPE, LOOP, UNIT.",
-            ErrorCode.DATA_OUT_OF_RANGE: "Data out of range. This occurs when the parameter is outside the acceptable value.",
-            ErrorCode.PROGRAM_RUNNING: "Program currently running. This occurs when the mainframe delivers new commands to the module before the process of delivering commands to the module and receiving responses is completed.",
-            ErrorCode.DEVICE_SPECIFIC_ERROR: "Device specific error. This occurs when the GPIB Address number that you are trying to set exceeds 32.",
-            ErrorCode.NOT_MEASUREMENT_MODULE: "Is not Measurement Module. This occurs when user attempts to deliver a command to a module (slot) that is not installed.",
-            ErrorCode.QUEUE_OVERFLOW: "Queue overflow. This occurs when the Queue space used for communication between internal Tasks is full, and there is no space to store information.",
-            ErrorCode.QUEUE_EMPTY: "Queue empty. This occurs when there is no message in the Queue space used for communication between internal Tasks.",
-            ErrorCode.UPP_COMM_HEADER_ERROR: "uPP Comm. Header Error. This occurs when the Headers of the Packet used to send and receive data between the mainframe and the module are different.",
-            ErrorCode.UPP_COMM_RSP_NO: "uPP Comm. Rsp No. This occurs when the mainframe sends data information to the module but does not receive a response.",
-            ErrorCode.UPP_COMM_MODULE_MISMATCHED: "uPP Comm. Module Mismatched. This occurs when the mainframe receives information from a different module than the one that sent the data.",
-            ErrorCode.TCPIP_COMM_ERROR: "TCPIP Comm. Error. This occurs when all data to be transferred is not sent in TCP/IP communication.",
-            ErrorCode.GPIB_TX_NOT_COMPLETED: "GPIB Tx not completed. This occurs when no event is delivered to the internal GPIB Task used for GPIB communication.",
-            ErrorCode.GPIB_TX_TIMER_EXPIRED: "GPIB Tx Timer Expired. This occurs when all data to be transferred is not sent in GPIB communication.",
-            ErrorCode.MC_TRIG_ERROR: "MC Trig. Error. This occurs when the mainframe does not receive a measurement completion signal (H/W signal) from the module after the measurement command was delivered to the module.",
-            ErrorCode.SEM_NOT_EXIST: "not exist SEM. This occurs when an unregistered message is delivered between internal tasks.",
-        }
-        return error_descriptions.get(error_code, "Unknown error")
+        """
+        Gets the description of an error code.
+
+        Parameters:
+            error_code: An ErrorCode member or its raw integer value.
+                        ErrorCode members are integers, so both are looked up directly.
+        """
+        return _ERROR_DESCRIPTIONS.get(error_code, "Unknown error")
+
+
+# ErrorCode members keyed by their integer value, to skip the Enum lookup in get_error_info
+_CODE_MAP = {error_code.value: error_code for error_code in ErrorCode}
+
+# Error descriptions keyed by ErrorCode, built once at import (IntEnum keys also match raw ints)
+_ERROR_DESCRIPTIONS = {
+    ErrorCode.NO_ERROR: "No error",
+    ErrorCode.INVALID_CHARACTER: "Invalid character. This occurs when unacceptable characters are received for Command or Parameter. Unacceptable characters: '%', '&', '$', '#', '~'.",
+    ErrorCode.INVALID_SEPARATOR: "Invalid separator. This occurs when an unacceptable character is received as a separator between the Command and the Parameter. Unacceptable characters: '`', ';'.",
+    ErrorCode.DATA_TYPE_ERROR: "Data type error. This occurs when the Parameter is not an acceptable data type.",
+    ErrorCode.PARAMETER_NOT_ALLOWED: "Parameter not allowed. This occurs when the number of parameters in the corresponding command is more or less than expected.",
+    ErrorCode.MISSING_PARAMETER: "Missing parameter. This occurs when the number of characters in the Parameter is longer than 18.",
+    ErrorCode.COMMAND_HEADER_ERROR: "Command header error. This occurs when the number of characters in the Command is longer than 13.",
+    ErrorCode.UNDEFINED_HEADER: "Undefined Header. This occurs when an unsupported command is received.",
+    ErrorCode.SETTING_CONFLICT: "Setting conflict. This occurs when one of the following setup commands (other than STOP or STAT?) was received before measurement using 'MEAS' command is completed: AVG, LEV, LOGN, AUTO, WAVE, WMOD, WSET, SPE, LOOP, UNIT.",
+    ErrorCode.DATA_OUT_OF_RANGE: "Data out of range. This occurs when the parameter is outside the acceptable value.",
+    ErrorCode.PROGRAM_RUNNING: "Program currently running. This occurs when the mainframe delivers new commands to the module before the process of delivering commands to the module and receiving responses is completed.",
+    ErrorCode.DEVICE_SPECIFIC_ERROR: "Device specific error. This occurs when the GPIB Address number that you are trying to set exceeds 32.",
+    ErrorCode.NOT_MEASUREMENT_MODULE: "Is not Measurement Module. This occurs when user attempts to deliver a command to a module (slot) that is not installed.",
+    ErrorCode.QUEUE_OVERFLOW: "Queue overflow. This occurs when the Queue space used for communication between internal Tasks is full, and there is no space to store information.",
+    ErrorCode.QUEUE_EMPTY: "Queue empty. This occurs when there is no message in the Queue space used for communication between internal Tasks.",
+    ErrorCode.UPP_COMM_HEADER_ERROR: "uPP Comm. Header Error. This occurs when the Headers of the Packet used to send and receive data between the mainframe and the module are different.",
+    ErrorCode.UPP_COMM_RSP_NO: "uPP Comm. Rsp No. This occurs when the mainframe sends data information to the module but does not receive a response.",
+    ErrorCode.UPP_COMM_MODULE_MISMATCHED: "uPP Comm. Module Mismatched. This occurs when the mainframe receives information from a different module than the one that sent the data.",
+    ErrorCode.TCPIP_COMM_ERROR: "TCPIP Comm. Error. This occurs when all data to be transferred is not sent in TCP/IP communication.",
+    ErrorCode.GPIB_TX_NOT_COMPLETED: "GPIB Tx not completed. This occurs when no event is delivered to the internal GPIB Task used for GPIB communication.",
+    ErrorCode.GPIB_TX_TIMER_EXPIRED: "GPIB Tx Timer Expired. This occurs when all data to be transferred is not sent in GPIB communication.",
+    ErrorCode.MC_TRIG_ERROR: "MC Trig. Error. This occurs when the mainframe does not receive a measurement completion signal (H/W signal) from the module after the measurement command was delivered to the module.",
+    ErrorCode.SEM_NOT_EXIST: "not exist SEM. This occurs when an unregistered message is delivered between internal tasks.",
+}
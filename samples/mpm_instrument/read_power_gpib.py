@@ -2,15 +2,28 @@
 Program to perform MPM read power operation via GPIB.
 """
 
-import time
-import pyvisa
+import asyncio
+import os
+import sys
+
+# The shared resource manager (_rm.py) lives in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM
+
+
+def open_mpm(resource_name):
+    """Opens an MPM session on the shared ResourceManager."""
+    instrument = RM.open_resource(resource_name,
+                                  read_termination="\n")
+
+    # Read each 'READ?' response in a single low-level VISA read
+    instrument.chunk_size = 65536
+    return instrument
 
-rm = pyvisa.ResourceManager()
 
 mpm_resource_name = 'GPIB0::16::INSTR'
 
-mpm = rm.open_resource(mpm_resource_name,
-                       read_termination="\n")
+mpm = open_mpm(mpm_resource_name)
 
 print(mpm.query("*IDN?"))
 
@@ -21,19 +34,57 @@ mpm.write("*CLS")
 measurement_mode = "FREERUN"
 mpm.write(f"WMOD {measurement_mode}")
 
-module_number = int(input("\nEnter the module to read from: "))
+modules = [int(module) for module in input("\nEnter the module(s) to read from (e.g. 0 or 0,1): ").split(',')]
 delay_time = float(input("\nEnter the delay time (in seconds) between each read operation: "))
 
-input("\nPress Enter to start the measurement")
-print("Hit Ctrl + C to stop the measurement\n")
+# Latest response of each module
+responses = {}
 
-try:
+# Format of one module's entry on the status line
+line_format = "Module {} : {}"
+
+
+async def poll(module, lock, queue):
+    """Reads the power of one module every delay_time seconds and hands the response to the printer."""
+    loop = asyncio.get_running_loop()
+    while True:
+        # The blocking VISA query runs in a worker thread, so the other modules keep being polled.
+        # The lock keeps the write/read pairs of the shared session from interleaving.
+        async with lock:
+            response = await loop.run_in_executor(None, mpm.query, f'READ? {module}')
+
+        queue.put_nowait((module, response))
+
+        await asyncio.sleep(delay_time)
+
+
+async def printer(queue):
+    """Redraws the status line once per batch of queued responses instead of once per read."""
     while True:
-        response = mpm.query(f'READ? {module_number}')
+        module, response = await queue.get()
+        responses[module] = response
+
+        # Fold in everything else already queued before touching the terminal
+        while not queue.empty():
+            module, response = queue.get_nowait()
+            responses[module] = response
+
+        sys.stdout.write("\r" + " | ".join(line_format.format(m, r) for m, r in responses.items()))
+        sys.stdout.flush()
+
 
-        print(f"\rRead response : {response}", end="")
+async def poll_all():
+    """Polls all the selected modules concurrently."""
+    lock = asyncio.Lock()
+    queue = asyncio.Queue()
+    await asyncio.gather(printer(queue), *(poll(module, lock, queue) for module in modules))
 
-        time.sleep(delay_time)
+
+input("\nPress Enter to start the measurement")
+print("Hit Ctrl + C to stop the measurement\n")
+
+try:
+    asyncio.run(poll_all())
 
 except KeyboardInterrupt:
     pass
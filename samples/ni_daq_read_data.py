@@ -1,5 +1,9 @@
+import threading
+
 import nidaqmx
-from nidaqmx.constants import TerminalConfiguration
+import numpy as np
+from nidaqmx.constants import AcquisitionType, TerminalConfiguration
+from nidaqmx.stream_readers import AnalogMultiChannelReader
 
 # Define the DAQ device and channel names
 device_name = "Dev1"       # Replace with the name of your DAQ device
@@ -20,15 +24,74 @@ try:
             max_val=5.0    # Maximum voltage range (in volts)
         )
 
-        # Define the sample size (number of samples to read per channel)
+        # Define the sample size (number of samples to read per channel for each block)
         sample_size = 100
 
-        # Read the specified number of samples from the channel(s)
-        data = task.read(number_of_samples_per_channel=sample_size)
+        # Sample clock rate (samples per second per channel)
+        sample_rate = 1000.0
+
+        # Number of blocks to acquire before stopping
+        acquisitions = 1
+
+        # Hardware-timed continuous acquisition; the driver buffer holds several blocks
+        task.timing.cfg_samp_clk_timing(sample_rate,
+                                        sample_mode=AcquisitionType.CONTINUOUS,
+                                        samps_per_chan=sample_size * 10)
+
+        # Stream reader that fills a NumPy buffer directly instead of building Python lists
+        reader = AnalogMultiChannelReader(task.in_stream)
+
+        # Allocate the buffer once: one block per acquisition, one row per channel, one column per sample
+        data = np.empty((acquisitions, task.number_of_channels, sample_size), dtype=np.float64)
+
+        # Set once the requested number of blocks has been read, or when reading a block fails
+        done = threading.Event()
+        blocks_read = 0
+        callback_error = None
+
+        def on_samples_acquired(task_handle, event_type, number_of_samples, callback_data):
+            """
+            Called by the driver thread each time sample_size samples per channel are in its buffer.
+            Only copies the block into the preallocated buffer; the data is printed by the main thread.
+            """
+            global blocks_read, callback_error
+            if done.is_set():
+                return 0
+
+            try:
+                reader.read_many_sample(data[blocks_read], number_of_samples_per_channel=sample_size, timeout=10.0)
+            except Exception as error:
+                # Hand the error over to the main thread instead of raising it in the driver thread
+                callback_error = error
+                done.set()
+                return 0
+
+            blocks_read += 1
+            if blocks_read >= acquisitions:
+                done.set()
+            return 0
+
+        # Register the callback before starting the task
+        task.register_every_n_samples_acquired_into_buffer_event(sample_size, on_samples_acquired)
+
+        # Time needed for all blocks at the sample clock rate, plus a margin for starting the task
+        wait_timeout = acquisitions * sample_size / sample_rate + 10.0
+
+        # Start the acquisition and wait until all blocks have been handled.
+        # The task is stopped in any case, also when the wait times out or a block could not be read.
+        task.start()
+        try:
+            if not done.wait(wait_timeout):
+                raise TimeoutError(f"Only {blocks_read} of {acquisitions} blocks acquired within {wait_timeout:.1f} s.")
+            if callback_error is not None:
+                raise callback_error
+        finally:
+            task.stop()
 
         # Output the acquired data
-        print("Data acquired:")
-        print(data)
+        for block in data:
+            print("Data acquired:")
+            print(block)
 
 except Exception as e:
     # Handle any errors that occur during setup or data acquisition
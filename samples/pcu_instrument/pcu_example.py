@@ -1,14 +1,16 @@
-from pcu_instrument import PCU
-import pyvisa
-
-# Initialize PyVISA resource manager
-rm = pyvisa.ResourceManager()
+import os
+import sys
 
-# Open a connection to the PCU instrument via GPIB
-instrument = rm.open_resource('GPIB0::5::INSTR')        # Replace with your instrument's GPIB address
+from pcu_instrument import PCU
 
-# Create a connection of the PCU class
-pcu = PCU(instrument)
+# The shared resource manager (_rm.py) lives in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM
 
-# Print the instrument identification
-print(pcu.get_idn())
+# Open a connection to the PCU instrument via GPIB, closed when the block ends
+with RM.open_resource('GPIB0::5::INSTR') as instrument:        # Replace with your instrument's GPIB address
+    # Create a connection of the PCU class (sets the '\r\n' read termination, pass read_termination=None to keep the resource's).
+    # Its worker thread is stopped when the inner block ends.
+    with PCU(instrument) as pcu:
+        # Print the instrument identification
+        print(pcu.get_idn())
@@ -6,19 +6,213 @@ Communication: GPIB | LAN (PyVISA)
 Last Updated: Tue Feb 04, 2025 11:00
 """
 
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from types import MappingProxyType
+
+# STB, ESE and SRE values of get_status_block younger than this (in seconds) are reused
+STATUS_BLOCK_TTL = 0.01
+
+# Cached network settings younger than this (in seconds) are reused
+NETWORK_TTL = 1.0
+
+
+def _cached_query(ttl=None):
+    """
+    Caches the result of a getter in the instance's _cache, keyed by the getter name.
+    ttl: Lifetime of the result in seconds, None to keep it until the cache entry is dropped.
+    """
+    def decorator(getter):
+        key = getter.__name__
+
+        @functools.wraps(getter)
+        def wrapper(self):
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry is None or (ttl is not None and now - entry[0] > ttl):
+                entry = (now, getter(self))
+                self._cache[key] = entry
+            return entry[1]
+
+        return wrapper
+
+    return decorator
+
+
+def _install_accessors(cls):
+    """
+    Class decorator that adds the get_<name>/set_<name> pairs described by
+    cls._CODED_SETTINGS and cls._TEXT_SETTINGS.
+    """
+    for name, (description, parameter, query, command, table, unknown, label) in cls._CODED_SETTINGS.items():
+        _add_coded_setting(cls, name, description, parameter, query, command, table, unknown, label)
+    for name, (description, parameter, command) in cls._TEXT_SETTINGS.items():
+        _add_text_setting(cls, name, description, parameter, command)
+    return cls
+
+
+def _make_setter(parameter, annotation, body, namespace):
+    """
+    Compiles a setter method taking one argument named parameter, so that the generated setters keep
+    the keyword names of the methods they replace (e.g. set_polarization(state=1)).
+    body: Source lines of the method, using parameter; namespace: The names they refer to.
+    """
+    source = f"def setter(self, {parameter}: {annotation.__name__}):\n" + "".join(f"    {line}\n" for line in body)
+    exec(source, namespace)
+    return namespace['setter']
+
+
+def _add_coded_setting(cls, name, description, parameter, query, command, table, unknown, label):
+    """Adds a getter decoding an integer response code through table, and a checked setter sending command."""
+    codes = [code for code, text in enumerate(table) if text]
+    options = "".join(f"\n                {code}: {table[code]}" for code in codes)
+
+    def getter(self):
+        return self._decode(table, self._query(query), unknown)
+
+    setter = _make_setter(parameter, int, [
+        f"if {parameter} not in codes:",
+        f"    raise Exception(f'Invalid {{label}} value {{{parameter}}}.')",
+        f"self.write_bytes(command % {parameter})",
+    ], {'codes': codes, 'command': command, 'label': label})
+
+    getter.__name__, getter.__qualname__ = f'get_{name}', f'{cls.__name__}.get_{name}'
+    getter.__doc__ = f"Gets the {description}."
+    setter.__name__, setter.__qualname__ = f'set_{name}', f'{cls.__name__}.set_{name}'
+    setter.__doc__ = f"""
+        Sets the {description}.
 
+        Parameters:
+            {parameter} (int): The {description} to set.{options}
+        """
+    setattr(cls, getter.__name__, getter)
+    setattr(cls, setter.__name__, setter)
+
+
+def _add_text_setting(cls, name, description, parameter, command):
+    """Adds a getter cached for NETWORK_TTL and a setter that drops the cached value before writing."""
+    def getter(self):
+        return self._query(f'{command}?')
 
+    setter = _make_setter(parameter, str, [
+        "self._cache.pop(key, None)",
+        f"self._write(f'{{command}} {{{parameter}}}')",
+    ], {'key': f'get_{name}', 'command': command})
+
+    getter.__name__, getter.__qualname__ = f'get_{name}', f'{cls.__name__}.get_{name}'
+    getter.__doc__ = f"Gets the {description}."
+    setter.__name__, setter.__qualname__ = f'set_{name}', f'{cls.__name__}.set_{name}'
+    setter.__doc__ = f"""
+        Sets the {description}.
+
+        Parameters:
+            {parameter} (str): The {description} to set.
+        """
+    setattr(cls, getter.__name__, _cached_query(NETWORK_TTL)(getter))
+    setattr(cls, setter.__name__, setter)
+
+
+@_install_accessors
 class PCU:
-    def __init__(self, connection):
+    __slots__ = ('instance', '_query', '_write', '_write_raw', '_cache', '_status_block', '_pol_commands', '_executor')
+
+    # Response maps of the getters, indexed by the integer response code (None for unused codes)
+    _POL = (
+        None,
+        "Vertical Linear Polarization",
+        "Horizontal Linear Polarization",
+        "+45° Linear Polarization",
+        "-45° Linear Polarization",
+        "Right Hand Circular Polarization",
+        "Left Hand Circular Polarization"
+    )
+    _POW_UNIT = ("dBm", "mW")
+    _GPIB_DEL = ("CR", "LF", "CR+LF", "None")
+    _DHCP = ("DHCP disable", "DHCP enable")
+
+    # Precompiled commands of the integer setters, formatted with bytes % and sent by write_bytes
+    _CMD_ESE = b'*ESE %d'
+    _CMD_SRE = b'*SRE %d'
+    _CMD_POL = b':POL %d'
+    _CMD_POW_UNIT = b':POW:UNIT %d'
+    _CMD_GPIB_ADDR = b':SYST:COMM:GPIB:ADDR %d'
+    _CMD_GPIB_DEL = b':SYST:COMM:GPIB:DEL %d'
+    _CMD_DHCP = b':SYST:COMM:ETH:DHCP %d'
+    _CMD_PORT = b':SYST:COMM:ETH:PORT %d'
+
+    # Settings with an integer code: name -> (description, setter parameter name, query, command,
+    # response map, text for unknown responses, name used in error messages). See _add_coded_setting.
+    _CODED_SETTINGS = {
+        'polarization': ("polarization state", 'state', ':POL?', _CMD_POL, _POL,
+                         "Unknown Polarization State", "polarization state"),
+        'power_unit': ("power unit", 'unit', ':POW:UNIT?', _CMD_POW_UNIT, _POW_UNIT,
+                       "Unknown Power Unit", "unit"),
+        'gpib_delimiter': ("GPIB command delimiter", 'delimiter', ':SYST:COMM:GPIB:DEL?', _CMD_GPIB_DEL, _GPIB_DEL,
+                           "Unknown delimiter", "delimiter"),
+        'ethernet_dhcp': ("Ethernet DHCP state", 'state', ':SYST:COMM:ETH:DHCP?', _CMD_DHCP, _DHCP,
+                          "Unknown DHCP state", "state"),
+    }
+
+    # Text network settings: name -> (description, setter parameter name, command). See _add_text_setting.
+    _TEXT_SETTINGS = {
+        'ip_address': ("Ethernet IP address", 'ip', ':SYST:COMM:ETH:IPAD'),
+        'subnet_mask': ("Ethernet subnet mask", 'mask', 'SYST:COMM:ETH:SMAS'),
+        'gateway': ("Ethernet gateway", 'gateway', ':SYST:COMM:ETH:DGAT'),
+    }
+
+    def __init__(self, connection, read_termination='\r\n'):
         """
         Initializes the PCU class with an opened PyVISA resource.
 
         Parameters:
             connection: An open PyVISA resource representing the connected instrument.
+            read_termination: Response terminator of the PCU. With a known terminator the responses are read
+                              in chunks instead of waiting for the end of the message.
+                              None keeps the termination the resource was opened with.
         """
         self.instance = connection
 
+        # Bound methods of the resource, so the accessors below call it without going through query/write
+        self._query = connection.query
+        self._write = connection.write
+        self._write_raw = connection.write_raw
+
+        if read_termination is not None:
+            self.instance.read_termination = read_termination
+
+        # Read each response in one low-level call and do not wait between the write and read of a query
+        try:
+            self.instance.chunk_size = 1 << 20
+            self.instance.query_delay = 0.0
+        except AttributeError:
+            pass
+
+        # Cached getter results as {getter name: (time, result)}, see _cached_query.
+        # Cleared on reset and reboot; a setter drops the entry of its getter.
+        self._cache = {}
+        # Time and (STB, ESE, SRE) values of the last compound query of get_status_block
+        self._status_block = (0.0, None)
+        # Encoded ':POL 1' to ':POL 6' commands for set_polarization_fast
+        self._pol_commands = {state: self._CMD_POL % state for state in range(1, 7)}
+        # Single worker, so background queries of this instrument stay serialized
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def close(self):
+        """
+        Stops the worker thread of the background query methods, once their pending queries are done.
+        The PyVISA resource is left open, it is closed by its owner.
+        """
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def query(self, command):
         """
         Sends a query command to the instrument and returns the response.
@@ -40,6 +234,58 @@ class PCU:
         """
         self.instance.write(command)
 
+    def _query_float(self, command):
+        """
+        Queries a short numeric response and parses it from the raw bytes,
+        skipping the str decoding and termination handling of query.
+        """
+        self._write(command)
+        return float(self.instance.read_raw(64).rstrip(b'\r\n'))
+
+    def _query_int(self, command):
+        """Same as _query_float for integer responses."""
+        self._write(command)
+        return int(self.instance.read_raw(64).rstrip(b'\r\n'))
+
+    def query_ascii_values(self, command, **kwargs):
+        """
+        Queries a comma-separated list of values and converts it in a single read.
+
+        Parameters:
+            command (str): The command to query the instrument.
+            kwargs: Keyword arguments of the PyVISA query_ascii_values (converter, separator, container).
+
+        Returns:
+            list: The values of the response.
+        """
+        return self.instance.query_ascii_values(command, **kwargs)
+
+    def write_bytes(self, command: bytes):
+        """
+        Sends an already encoded command to the instrument, skipping the str formatting and encoding of write.
+
+        Parameters:
+            command (bytes): The command to send to the instrument, without terminator.
+                The resource's current write termination is appended.
+        """
+        self._write_raw(command + (self.instance.write_termination or '').encode('ascii'))
+
+    def write_many(self, commands, batched: bool = True):
+        """
+        Sends several commands to the instrument.
+
+        Parameters:
+            commands (list[str]): The commands to send to the instrument.
+            batched (bool): True joins the commands with ';' into a single write.
+                            False sends them one by one, for firmware that does not accept concatenated commands.
+        """
+        if batched:
+            self._write(';'.join(commands))
+        else:
+            for command in commands:
+                self._write(command)
+
+    @_cached_query()
     def get_idn(self) -> str:
         """
         Identification Query.
@@ -47,7 +293,7 @@ class PCU:
 
         Response: SANTEC,TSL-570,21020001,0001.0000.0001
         """
-        return self.query('*IDN?')
+        return self._query('*IDN?')
 
     def device_reset(self):
         """
@@ -57,7 +303,8 @@ class PCU:
         ・Command input queue
         ・Error queue
         """
-        self.write('*RST')
+        self._cache.clear()
+        self._write('*RST')
 
     def get_self_test_query(self):
         """
@@ -65,7 +312,7 @@ class PCU:
         Initiates an instrument self-test and places the results in the
         output queue.
         """
-        response = self.query('*TST?')
+        response = self._query('*TST?')
         return "No Error" if response == '0' else "Error"
 
     def get_operation_complete_query(self):
@@ -73,7 +320,7 @@ class PCU:
         Operation Complete Query.
         Places 1 in the output queue when all operation processing is completed.
         """
-        response = self.query('*OPC?')
+        response = self._query('*OPC?')
         return "In operation" if response == '0' else "Operation completed" if response == '1' else ""
 
     def clear_status(self):
@@ -86,11 +333,11 @@ class PCU:
         ・Standard Event Status Register
         ・Error Queue
         """
-        self.write('*CLS')
+        self._write('*CLS')
 
     def get_standard_event_enable_register(self):
         """Gets the Standard Event Enable Register (SEER)."""
-        return int(self.query('*ESE?'))
+        return self._query_int('*ESE?')
 
     def set_standard_event_enable_register(self, value: int):
         """
@@ -98,15 +345,17 @@ class PCU:
 
         Parameter Setting value from 0 to 255
         """
-        self.write(f'*ESE {value}')
+        if not 0 <= value <= 255:
+            raise Exception(f"Value {value} out of range.")
+        self.write_bytes(self._CMD_ESE % value)
 
     def get_standard_event_status_register(self):
         """Gets the Standard Event Status Register (SESR)."""
-        return int(self.query('*ESR?'))
+        return self._query_int('*ESR?')
 
     def get_service_request_enable_register(self):
         """Gets the Service Request Enable Register (SRER)."""
-        return int(self.query('*SRE?'))
+        return self._query_int('*SRE?')
 
     def set_service_request_enable_register(self, value: int):
         """
@@ -115,88 +364,109 @@ class PCU:
 
         Parameter: Setting value from 0 to 255
         """
-        self.query(f'*SRE {value}')
+        if not 0 <= value <= 255:
+            raise Exception(f"Value {value} out of range.")
+        self.write_bytes(self._CMD_SRE % value)
 
     def get_status_byte_register(self):
         """Gets the Status Byte Register (STBR)"""
-        return int(self.query('*STB?'))
+        return self._query_int('*STB?')
+
+    def get_status_block(self) -> dict:
+        """
+        Gets the Status Byte, Standard Event Status, Standard Event Enable and
+        Service Request Enable registers with the single compound query '*STB?;*ESR?;*ESE?;*SRE?'.
+        Calls within STATUS_BLOCK_TTL seconds of each other share the STB, ESE and SRE values of one query.
+        Reading *ESR? clears the register, so it is never served from the cache: those calls query '*ESR?' alone.
 
-    def get_polarization(self) -> str:
-        """Gets the polarization state."""
-        response = self.query(':POL?')
-        polarization_states = {
-            '1': "Vertical Linear Polarization",
-            '2': "Horizontal Linear Polarization",
-            '3': "+45° Linear Polarization",
-            '4': "-45° Linear Polarization",
-            '5': "Right Hand Circular Polarization",
-            '6': "Left Hand Circular Polarization"
-        }
-        return polarization_states.get(response, "Unknown Polarization State")
+        Returns:
+            dict: {'stb': int, 'esr': int, 'ese': int, 'sre': int}
+        """
+        timestamp, registers = self._status_block
+        now = time.monotonic()
+        if registers is None or now - timestamp > STATUS_BLOCK_TTL:
+            # Parse the raw bytes; int() accepts them directly, so no str is built per register
+            self._write('*STB?;*ESR?;*ESE?;*SRE?')
+            stb, esr, ese, sre = map(int, self.instance.read_raw().rstrip(b'\r\n').split(b';'))
+            self._status_block = (now, (stb, ese, sre))
+        else:
+            stb, ese, sre = registers
+            esr = self._query_int('*ESR?')
+        return {'stb': stb, 'esr': esr, 'ese': ese, 'sre': sre}
 
-    def set_polarization(self, state: int):
+    def query_async(self, command):
         """
-        Sets the polarization state.
+        Sends a query from this instrument's worker thread and returns immediately.
+        Queries of one instrument run one after another; different instruments progress concurrently.
 
         Parameters:
-            state (int): The polarization state to set.
-                    1: Vertical Linear Polarization
-                    2: Horizontal Linear Polarization
-                    3: +45°Linear Polarization
-                    4: -45°Linear Polarization
-                    5: Right Hand Circular Polarization
-                    6: Left Hand Circular Polarization
-        """
-        if state not in [1, 2, 3, 4, 5, 6]:
-            raise Exception(f"Invalid polarization state value {state}.")
-        self.write(f':POL {state}')
-
-    def get_power_unit(self) -> str:
-        """Gets the power unit."""
-        response = self.query(':POW:UNIT?')
-        power_units = {
-            '0': "dBm",
-            '1': "mW"
-        }
-        return power_units.get(response, "Unknown Power Unit")
-
-    def set_power_unit(self, unit: int):
-        """
-        Sets the power unit.
+            command (str): The command to query the instrument.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the response from the instrument.
+        """
+        return self._executor.submit(self.query, command)
+
+    async def aquery(self, command):
+        """
+        Coroutine version of query; the blocking VISA query runs in this instrument's worker thread,
+        so several instruments can be queried concurrently from one event loop.
 
         Parameters:
-            unit (str): The power unit to set.
-                    0: dBm
-                    1: mW
+            command (str): The command to query the instrument.
+
+        Returns:
+            str: The response from the instrument.
         """
-        if unit not in [0, 1]:
-            raise Exception(f"Invalid unit value {unit}.")
-        self.write(f':POW:UNIT {unit}')
+        return await asyncio.wrap_future(self.query_async(command))
+
+    async def get_status_block_async(self) -> dict:
+        """Coroutine version of get_status_block."""
+        return await asyncio.wrap_future(self._executor.submit(self.get_status_block))
+
+    @staticmethod
+    def _decode(table, response, unknown):
+        """Returns the entry of a response map for a response code, or unknown if there is none."""
+        response = response.strip()
+        index = int(response) if response.isdigit() else -1
+        return table[index] if 0 <= index < len(table) and table[index] else unknown
+
+    def set_polarization_fast(self, state: int):
+        """
+        Same as set_polarization, sending one of six prebuilt commands.
+        For sweeps that switch the polarization in a tight loop.
+
+        Parameters:
+            state (int): The polarization state to set (1 to 6), see set_polarization.
+        """
+        command = self._pol_commands.get(state)
+        if command is None:
+            raise Exception(f"Invalid {self._CODED_SETTINGS['polarization'][-1]} value {state}.")
+        self.write_bytes(command)
 
     def get_monitor_power(self):
         """Gets the monitor power."""
-        return float(self.query(':POW:LEVEL?'))
+        return self._query_float(':POW:LEVEL?')
 
     def reboot_device(self):
         """Reboots the device."""
-        self.write('SPEC:REB')
+        self._cache.clear()
+        self._write('SPEC:REB')
 
     def get_system_error(self) -> str:
         """Gets the system error with a detailed description."""
-        response = self.query(':SYST:ERR?').strip()
-        try:
-            error_code = ErrorCode(response)
-            return f"{response}: {ErrorCode.get_description(error_code)}"
-        except ValueError:
-            return f"{response}: Unknown error code"
+        response = self._query(':SYST:ERR?').strip()
+        return f"{response}: {_DESC_BY_CODE.get(response, 'Unknown error code')}"
 
+    @_cached_query()
     def get_firmware_version(self) -> str:
         """Gets the firmware version."""
-        return self.query(':SYST:VERS?')
+        return self._query(':SYST:VERS?')
 
+    @_cached_query(NETWORK_TTL)
     def get_gpib_address(self) -> int:
         """Gets the GPIB address."""
-        return int(self.query(':SYST:COMM:GPIB:ADDR?'))
+        return self._query_int(':SYST:COMM:GPIB:ADDR?')
 
     def set_gpib_address(self, address: int):
         """
@@ -205,96 +475,35 @@ class PCU:
         Parameters:
             address (int): The GPIB address to set.
         """
-        self.write(f':SYST:COMM:GPIB:ADDR {address}')
-
-    def get_gpib_delimiter(self) -> str:
-        """Gets the GPIB command delimiter."""
-        response = self.query(':SYST:COMM:GPIB:DEL?')
-        delimiter_dict = {
-            '0': "CR",
-            '1': "LF",
-            '2': "CR+LF",
-            '3': "None"
-        }
-        return delimiter_dict.get(response, "Unknown delimiter")
-
-    def set_gpib_delimiter(self, delimiter: int):
-        """
-        Sets the GPIB command delimiter.
-
-        Parameters:
-            delimiter (str): The GPIB delimiter to set.
-                        0: CR
-                        1: LF
-                        2: CR+LF
-                        3: None
-        """
-        self.write(f':SYST:COMM:GPIB:DEL {delimiter}')
-
-    def get_ethernet_dhcp(self) -> str:
-        """Gets the Ethernet DHCP state."""
-        response = self.query(':SYST:COMM:ETH:DHCP?')
-        dhcp_state_dict = {
-            '0': "DHCP disable",
-            '1': "DHCP enable"
-        }
-        return dhcp_state_dict.get(response, "Unknown DHCP state")
+        self._cache.pop('get_gpib_address', None)
+        self.write_bytes(self._CMD_GPIB_ADDR % address)
 
-    def set_ethernet_dhcp(self, state: int):
+    def configure_ethernet(self, ip: str, mask: str, gateway: str, dhcp: int, batched: bool = True):
         """
-        Sets the Ethernet DHCP state.
-
-        Parameters:
-            state (str): The DHCP state to set.
-                    0: DHCP disable
-                    1: DHCP enable
-        """
-        if state not in [0, 1]:
-            raise Exception(f"Invalid state value {state}.")
-        self.write(f':SYST:COMM:ETH:DHCP {state}')
-
-    def get_ip_address(self) -> str:
-        """Gets the Ethernet IP address."""
-        return self.query(':SYST:COMM:ETH:IPAD?')
-
-    def set_ip_address(self, ip: str):
-        """
-        Sets the Ethernet IP address.
+        Sets the Ethernet IP address, subnet mask, gateway and DHCP state with a single write.
 
         Parameters:
             ip (str): The IP address to set.
-        """
-        self.write(f':SYST:COMM:ETH:IPAD {ip}')
-
-    def get_subnet_mask(self) -> str:
-        """Gets the Ethernet subnet mask."""
-        return self.query('SYST:COMM:ETH:SMAS?')
-
-    def set_subnet_mask(self, mask: str):
-        """
-        Sets the Ethernet subnet mask.
-
-        Parameters:
             mask (str): The subnet mask to set.
-        """
-        self.write(f'SYST:COMM:ETH:SMAS {mask}')
-
-    def get_gateway(self) -> str:
-        """Gets the Ethernet gateway."""
-        return self.query(':SYST:COMM:ETH:DGAT?')
-
-    def set_gateway(self, gateway: str):
-        """
-        Sets the Ethernet gateway.
-
-        Parameters:
             gateway (str): The gateway to set.
-        """
-        self.write(f':SYST:COMM:ETH:DGAT {gateway}')
-
+            dhcp (int): The DHCP state to set.
+                    0: DHCP disable
+                    1: DHCP enable
+            batched (bool): False sends the four commands separately (see write_many).
+        """
+        if dhcp not in [0, 1]:
+            raise Exception(f"Invalid state value {dhcp}.")
+        for getter in ('get_ip_address', 'get_subnet_mask', 'get_gateway'):
+            self._cache.pop(getter, None)
+        self.write_many([f':SYST:COMM:ETH:IPAD {ip}',
+                         f':SYST:COMM:ETH:SMAS {mask}',
+                         f':SYST:COMM:ETH:DGAT {gateway}',
+                         f':SYST:COMM:ETH:DHCP {dhcp}'], batched)
+
+    @_cached_query(NETWORK_TTL)
     def get_port_number(self) -> int:
         """Gets the Ethernet port."""
-        return int(self.query(':SYST:COMM:ETH:PORT?'))
+        return self._query_int(':SYST:COMM:ETH:PORT?')
 
     def set_port_number(self, port: int):
         """
@@ -303,9 +512,10 @@ class PCU:
         Parameters:
             port (int): The port number to set.
         """
-        if not (0 <= port <= 65535):
+        self._cache.pop('get_port_number', None)
+        if not 0 <= port <= 65535:
             raise Exception(f"Value {port} out of range.")
-        self.write(f':SYST:COMM:ETH:PORT {port}')
+        self.write_bytes(self._CMD_PORT % port)
 
 
 class ErrorCode(Enum):
@@ -324,18 +534,35 @@ class ErrorCode(Enum):
 
     @staticmethod
     def get_description(error_code) -> str:
-        error_descriptions = {
-            ErrorCode.NO_ERROR: "No error occurred during the operation.",
-            ErrorCode.SYNTAX_ERROR: "The command contains an invalid syntax or unrecognized format.",
-            ErrorCode.INVALID_SEPARATOR: "A separator in the command is missing or incorrect.",
-            ErrorCode.PARAMETER_NOT_ALLOWED: "The command contains an unexpected or unsupported parameter.",
-            ErrorCode.MISSING_PARAMETER: "Required parameter(s) are missing from the command.",
-            ErrorCode.UNDEFINED_HEADER: "The command header is syntactically correct but not supported by the device.",
-            ErrorCode.INVALID_SUFFIX: "A suffix in the command is invalid or incorrectly formatted.",
-            ErrorCode.CHARACTER_DATA_NOT_ALLOWED: "Character data was received where it is not permitted.",
-            ErrorCode.EXECUTION_ERROR: "The device is in a state that prevents execution of the command.",
-            ErrorCode.DATA_OUT_OF_RANGE: "A parameter value is outside the permissible range.",
-            ErrorCode.ILLEGAL_PARAMETER_VALUE: "A specific value expected by the command is invalid.",
-            ErrorCode.QUERY_INTERRUPTED: "The query was interrupted due to an unexpected condition.",
-        }
-        return error_descriptions.get(ErrorCode(error_code), f"Unknown Error Code: {error_code}")
+        """
+        Gets the description of an error code.
+
+        Parameters:
+            error_code: An ErrorCode member or its code string (e.g. "-102").
+        """
+        member = error_code if isinstance(error_code, ErrorCode) else _CODE_BY_STRING.get(error_code)
+        return _ERROR_DESCRIPTIONS.get(member, f"Unknown Error Code: {error_code}")
+
+
+# Error descriptions keyed by ErrorCode, built once at import
+_ERROR_DESCRIPTIONS = MappingProxyType({
+    ErrorCode.NO_ERROR: "No error occurred during the operation.",
+    ErrorCode.SYNTAX_ERROR: "The command contains an invalid syntax or unrecognized format.",
+    ErrorCode.INVALID_SEPARATOR: "A separator in the command is missing or incorrect.",
+    ErrorCode.PARAMETER_NOT_ALLOWED: "The command contains an unexpected or unsupported parameter.",
+    ErrorCode.MISSING_PARAMETER: "Required parameter(s) are missing from the command.",
+    ErrorCode.UNDEFINED_HEADER: "The command header is syntactically correct but not supported by the device.",
+    ErrorCode.INVALID_SUFFIX: "A suffix in the command is invalid or incorrectly formatted.",
+    ErrorCode.CHARACTER_DATA_NOT_ALLOWED: "Character data was received where it is not permitted.",
+    ErrorCode.EXECUTION_ERROR: "The device is in a state that prevents execution of the command.",
+    ErrorCode.DATA_OUT_OF_RANGE: "A parameter value is outside the permissible range.",
+    ErrorCode.ILLEGAL_PARAMETER_VALUE: "A specific value expected by the command is invalid.",
+    ErrorCode.QUERY_INTERRUPTED: "The query was interrupted due to an unexpected condition.",
+})
+
+# ErrorCode members keyed by the code string returned by :SYST:ERR?
+_CODE_BY_STRING = MappingProxyType({error_code.value: error_code for error_code in ErrorCode})
+
+# Error descriptions keyed directly by the code string, for get_system_error
+_DESC_BY_CODE = MappingProxyType({error_code.value: description
+                                  for error_code, description in _ERROR_DESCRIPTIONS.items()})
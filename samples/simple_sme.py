@@ -8,6 +8,11 @@ Supported Communication modes
 GPIB and TCPIP.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared resource manager; sessions are reused on re-runs and closed at exit
+from _rm import get_resource
+
 # Import the SME class
 from sme_operation.sme_operation import SME
 
@@ -43,31 +48,29 @@ def main(tsl, mpm):
 
 
 if __name__ == "__main__":
-    # Import pyvisa
-    import pyvisa
-
-    # Create an instance of the Resource manager class
-    rm = pyvisa.ResourceManager()
-    # print(rm.list_resources())
-
     # Connect to the TSL and MPM instruments
-    tsl_instrument = rm.open_resource("GPIB2::3::INSTR", read_termination = '\r\n')
-    mpm_instrument = rm.open_resource("GPIB2::15::INSTR", read_termination = '\n')
+    tsl_instrument = get_resource("GPIB2::3::INSTR", read_termination = '\r\n')
+    mpm_instrument = get_resource("GPIB2::15::INSTR", read_termination = '\n')
 
     # Uncomment the below code to use TCPIP connection
-    # tsl_instrument = rm.open_resource("TCPIP::192.168.1.152::5000::SOCKET",
-    #                                   read_termination='\r',
-    #                                   open_timeout=5000)
-    # mpm_instrument = rm.open_resource("TCPIP::192.168.1.161::5000::SOCKET",
-    #                                   read_termination='\r',
-    #                                   open_timeout=5000)
+    # tsl_instrument = get_resource("TCPIP::192.168.1.152::5000::SOCKET",
+    #                               read_termination='\r',
+    #                               open_timeout=5000)
+    # mpm_instrument = get_resource("TCPIP::192.168.1.161::5000::SOCKET",
+    #                               read_termination='\r',
+    #                               open_timeout=5000)
 
     if not tsl_instrument or not mpm_instrument:
         raise Exception("Could not connect to TSL / MPM instrument(s).")
 
+    # Read the binary logging data in ~1 MB low-level reads instead of PyVISA's 20 kB default
+    mpm_instrument.chunk_size = 1024 * 1024
+
+    # Query both identifications at the same time, then print them in TSL, MPM order
     print("Connected to the instruments:")
-    print(tsl_instrument.query('*IDN?'))
-    print(mpm_instrument.query('*IDN?'))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for idn in executor.map(lambda instrument: instrument.query('*IDN?'), (tsl_instrument, mpm_instrument)):
+            print(idn)
 
     # Execute the main function
     main(tsl_instrument, mpm_instrument)
\ No newline at end of file
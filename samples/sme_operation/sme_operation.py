@@ -6,9 +6,12 @@ GPIB and TCPIP.
 """
 
 # Basic Imports
+import asyncio
 import time
 import logging
 
+from pyvisa import constants
+
 # Initialize the logger
 logger = logging.getLogger("SME Operation")
 logging.basicConfig(
@@ -25,6 +28,10 @@ class SME:
     def __init__(self, tsl, mpm):
         self.laser = tsl
         self.power_meter = mpm
+        # Sets the command delimiter for GPIB communication once per session
+        self.laser.write('SYST:COMM:GPIB:DEL 2')
+        # Read the binary logging data in ~1 MB low-level reads instead of PyVISA's 20 kB default
+        self.power_meter.chunk_size = 1024 * 1024
         logger.info("Initialized SME process.")
 
 
@@ -39,37 +46,40 @@ class SME:
         """Configure the TSL."""
         logger.info("Configuring TSL parameters.")
 
-        # Reset and basic setup
-        self.laser.write('*CLS')  # Clear status
-        self.laser.write('*RST')  # Reset device
-
-        # Sets the command set to Legacy.
-        self.laser.write('SYST:COMM:COD 0')
-
-        # Sets the command delimiter for GPIB communication.
-        self.laser.write('SYST:COMM:GPIB:DEL 2')
+        # Reset and basic setup, sent as one ';'-concatenated command
+        self.laser.write(';'.join([
+            '*CLS',  # Clear status
+            '*RST',  # Reset device
+            'SYST:COMM:COD 0',  # Sets the command set to Legacy.
+        ]))
 
         # Turn on output if off
         if int(self.laser.query('POW:STAT?')) == 0:
-            self.laser.write('POW:STAT 1')
-            while (
-                int(self.laser.query('*OPC?')) == 0
-            ):  # Queries the completion of operation.
-                time.sleep(0.5)
-
-        # Units and mode settings
-        self.laser.write('POW:UNIT 0')  # Set power unit to dBm
-        self.laser.write('WAV:UNIT 0')  # Set wavelength unit to nm
-        self.laser.write('POW:ATT:AUT 1')  # Auto power control mode
-        self.laser.write('COHCtrl 0')  # Disable coherence control
-        self.laser.write('POW:SHUT 0')  # Open the internal shutter
-
-        # Scan settings
-        self.laser.write(f'POW {output_power}')  # Set output power
-        self.laser.write(f'WAV:SWE:STAR {start_wavelength}')  # Set start wavelength
-        self.laser.write(f'WAV:SWE:STOP {stop_wavelength}')  # Set stop wavelength
-        self.laser.write(f'WAV:SWE:SPE {scan_speed}')  # Set sweep speed
-        self.laser.write(f'TRIG:OUTP:STEP {step_wavelength}')  # Set trigger step size
+            # *WAI holds further commands until the output is on,
+            # so a single *OPC? query returns once the operation is complete.
+            self.laser.write('POW:STAT 1;*WAI')
+            timeout = self.laser.timeout
+            self.laser.timeout = max(timeout, 60000)
+            try:
+                self.laser.query('*OPC?')
+            finally:
+                self.laser.timeout = timeout
+
+        # Units, mode and scan settings in a single write
+        write_start = time.perf_counter()
+        self.laser.write(';'.join([
+            'POW:UNIT 0',  # Set power unit to dBm
+            'WAV:UNIT 0',  # Set wavelength unit to nm
+            'POW:ATT:AUT 1',  # Auto power control mode
+            'COHCtrl 0',  # Disable coherence control
+            'POW:SHUT 0',  # Open the internal shutter
+            f'POW {output_power}',  # Set output power
+            f'WAV:SWE:STAR {start_wavelength}',  # Set start wavelength
+            f'WAV:SWE:STOP {stop_wavelength}',  # Set stop wavelength
+            f'WAV:SWE:SPE {scan_speed}',  # Set sweep speed
+            f'TRIG:OUTP:STEP {step_wavelength}',  # Set trigger step size
+        ]))
+        logger.info("TSL settings written in %.1f ms.", (time.perf_counter() - write_start) * 1000)
 
 
     def configure_mpm(
@@ -88,50 +98,53 @@ class SME:
         """
         logger.info(f"Configuring MPM parameters. Is MPM 215: {is_mpm_215}")
 
-        # Stop any ongoing measurements
-        self.power_meter.write('STOP')
-
-        # Set the mpm power unit to dBm
-        self.power_meter.write('UNIT 0')
+        commands = [
+            'STOP',  # Stop any ongoing measurements
+            'UNIT 0',  # Set the mpm power unit to dBm
+        ]
 
         # Set default manual dynamic range mode
         # and select SWEEP1 measurements mode
-        self.power_meter.write('AUTO 0')
-        self.power_meter.write('LEV 1')  # Sets the first dynamic range value (-30 ~ +10 dBm)
+        commands += [
+            'AUTO 0',
+            'LEV 1',  # Sets the first dynamic range value (-30 ~ +10 dBm)
+        ]
         measurement_mode = 'SWEEP1'
 
         # If MPM-215 module is connected, select auto dynamic range mode
         # and SWEEP2 measurements mode settings
         if is_mpm_215:
-            self.power_meter.write('AUTO 1')
+            commands.append('AUTO 1')
             measurement_mode = 'SWEEP2'
 
-        # Trigger settings
-        # Enable external trigger
-        self.power_meter.write('TRIG 1')
+        # Trigger and scan settings
+        commands += [
+            'TRIG 1',  # Enable external trigger
+            f'WMOD {measurement_mode}',
+            f'WSET {start_wavelength},{stop_wavelength},{step_wavelength}',
+            f'SPE {scan_speed}',  # Set sweep speed
+            '*WAI',  # Hold further commands until the settings are applied
+        ]
 
-        # Scan settings
-        self.power_meter.write(f'WMOD {measurement_mode}')
-        self.power_meter.write(f'WSET {start_wavelength},{stop_wavelength},{step_wavelength}')
-        self.power_meter.write(f'SPE {scan_speed}')  # Set sweep speed
+        # Send all the settings as one ';'-concatenated command
+        self.power_meter.write(';'.join(commands))
 
-        time.sleep(0.5)
-
-        # Force set the measurements mode if not set
-        while True:
-            if measurement_mode in self.power_meter.query('WMOD?'):
-                break
-            self.power_meter.write(f'WMOD {measurement_mode}')
-        print("Set Sweep mode: ", self.power_meter.query('WMOD?'))
+        # Verify the measurements mode once
+        sweep_mode = self.power_meter.query('WMOD?')
+        if measurement_mode not in sweep_mode:
+            raise RuntimeError(f"MPM rejected WMOD {measurement_mode}: got {sweep_mode}")
+        print("Set Sweep mode: ", sweep_mode)
 
         # Average wavelength setting
         average_wavelength = (start_wavelength + stop_wavelength) / 2
-        self.power_meter.write(f'WAV {average_wavelength}')
+        commands = [f'WAV {average_wavelength}']
 
         # Set the expected read data count
         if not is_mpm_215:
             data_count = int((stop_wavelength - start_wavelength) / step_wavelength + 1)
-            self.power_meter.write(f'LOGN {data_count}')
+            commands.append(f'LOGN {data_count}')
+
+        self.power_meter.write(';'.join(commands))
 
 
     def perform_scan(self, display_logging_status: bool = False):
@@ -140,13 +153,79 @@ class SME:
             f"Performing Scan. Display logging status: {display_logging_status}."
         )
 
+        self._start_scan()
+
+        # Start timer
+        start_time = time.time()
+
+        # Wait for measurements to complete, querying the status once per iteration.
+        # The response is "<status>,<count>"; only its first character is checked.
+        while True:
+            response = self.power_meter.query("STAT?")
+            if response[0] != '0':
+                break
+
+            # Print the MPM logging status
+            if display_logging_status:
+                self._print_logging_status(*response.split(','))
+            time.sleep(0.2)
+
+        self._finish_scan(start_time, *response.split(','))
+
+
+    async def perform_scan_async(self, display_logging_status: bool = False):
+        """
+        Executes the wavelength sweep as a coroutine.
+
+        The blocking VISA calls run in the default executor, so several SME
+        instances can scan concurrently, e.g.
+        asyncio.gather(sme1.perform_scan_async(), sme2.perform_scan_async()).
+        """
+        logger.info(
+            f"Performing Scan (async). Display logging status: {display_logging_status}."
+        )
+        loop = asyncio.get_running_loop()
+
+        await loop.run_in_executor(None, self._start_scan)
+
+        # Start timer
+        start_time = time.time()
+
+        # Wait for measurements to complete without blocking the event loop
+        while True:
+            response = await loop.run_in_executor(None, self.power_meter.query, "STAT?")
+            if response[0] != '0':
+                break
+
+            # Print the MPM logging status
+            if display_logging_status:
+                self._print_logging_status(*response.split(','))
+            await asyncio.sleep(0.05)
+
+        self._finish_scan(start_time, *response.split(','))
+
+
+    def _start_scan(self):
+        """Starts the MPM measurement and the TSL sweep, then issues the software trigger."""
         print("\nStarting the SME process....\n")
 
         # Start MPM measurements
         self.power_meter.write('MEAS')
 
         # Start TSL scan
-        self.laser.write(':WAV:SWE 1')
+        if self.laser.interface_type == constants.InterfaceType.gpib:
+            # Over GPIB, block until the TSL reports operation complete through a
+            # service request (*ESE 1 -> ESB, *SRE 32) instead of polling its status
+            self.laser.write('*CLS;*ESE 1;*SRE 32')
+            self.laser.enable_event(constants.EventType.service_request, constants.EventMechanism.queue)
+            try:
+                self.laser.write(':WAV:SWE 1;*OPC')
+                self.laser.wait_on_event(constants.EventType.service_request, 60000)
+            finally:
+                self.laser.disable_event(constants.EventType.service_request, constants.EventMechanism.queue)
+            self.laser.read_stb()  # Clear the service request
+        else:
+            self.laser.write(':WAV:SWE 1')
 
         # Check TSL status and force set TSL to start scan if not started
         scan_status = int(self.laser.query(':WAV:SWE?'))
@@ -158,26 +237,23 @@ class SME:
         # Issue software trigger to the TSL
         self.laser.write(':WAV:SWE:SOFT')
 
-        # Start timer
-        start_time = time.time()
 
-        # Wait for measurements to complete
-        while (
-                int(self.power_meter.query("STAT?").split(',')[0]) == 0
-        ):
-            # Print the MPM logging status
-            if display_logging_status:
-                status, count = self.power_meter.query("STAT?").split(',')
-                print_string = f"Logging Status: {status}. Data Count: {count}"
-                logger.debug(print_string)
-                print(print_string)
-            time.sleep(0.2)
+    @staticmethod
+    def _print_logging_status(status, count):
+        """Prints the intermediate MPM logging status."""
+        print_string = f"Logging Status: {status}. Data Count: {count}"
+        logger.debug(print_string)
+        print(print_string)
+
 
+    @staticmethod
+    def _finish_scan(start_time, status, count):
+        """Reports the final MPM logging status and the elapsed scan time."""
         # Scan end time and calculate elapsed time
         end_time = time.time()
         elapsed_time = round(end_time - start_time, 2)
 
-        status, count = self.power_meter.query("STAT?").split(',')
+        # The last status query already holds the final logging status and count
         print_string = f"Logging Status: {status}. Total Data Count: {count}"
         logger.info(print_string)
         print(f"\n{print_string}")
@@ -7,8 +7,11 @@ Dependencies: pyvisa, numpy, time
 """
 
 import time
-import pyvisa
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from pyvisa import constants
+
+from _rm import discover_gpib, get_resource
 
 
 # Initialize global variables
@@ -19,58 +22,69 @@ PD = None  # Photo diode
 def initialize_instruments():
     """Detects a TSL instrument via GPIB and initializes it."""
     global TSL, PD
-    rm = pyvisa.ResourceManager()
-    tools = [resource for resource in rm.list_resources() if 'GPIB' in resource]  # Filter GPIB devices
-    for tool in tools:
+    tools = discover_gpib()  # GPIB devices, scanned once per process
+
+    def identify(tool):
+        """Opens a resource and queries its identification."""
         try:
-            buffer = rm.open_resource(tool)
-            idn = buffer.query("*IDN?")
+            buffer = get_resource(tool)
+            return buffer, buffer.query("*IDN?")
+        except Exception as e:
+            print(f"Error while opening {tool}: {e}")
+            return None, ""
+
+    # Open and identify all the devices concurrently; the VISA calls release the GIL while waiting
+    with ThreadPoolExecutor(max_workers=max(1, len(tools))) as executor:
+        for buffer, idn in executor.map(identify, tools):
             if 'TSL' in idn:
                 TSL = buffer  # Assign TSL instrument
                 TSL.read_termination = "\r\n"
                 TSL.write_termination = "\r\n"
-        except Exception as e:
-            print(f"Error while opening {tool}: {e}")
+                TSL.write('SYST:COMM:GPIB:DEL 2')  # Set GPIB delimiter once per session
 
-    PD = rm.open_resource('GPIB0::10::INSTR')       # Replace the gpib resource of your photo diode.
+    PD = get_resource('GPIB0::10::INSTR')       # Replace the gpib resource of your photo diode.
+    PD.chunk_size = 1024 * 1024     # Read the binary measurement data in ~1 MB low-level reads
 
 
 def configure_tsl(power, start_wavelength, stop_wavelength, speed, step_size):
     """Configures the TSL instrument with the given parameters."""
-    TSL.write('*CLS')  # Clear status
-    TSL.write('*RST')  # Reset device
-    TSL.write('SYST:COMM:GPIB:DEL 2')  # Set GPIB delimiter
-    TSL.write('SYST:COMM:COD 1')  # Enable SCPI commands
+    # Reset and basic setup, sent as one ';'-concatenated command
+    TSL.write(';'.join([
+        '*CLS',  # Clear status
+        '*RST',  # Reset device
+        'SYST:COMM:COD 1',  # Enable SCPI commands
+    ]))
 
     if TSL.query('POW:STAT?') == '0':  # Check if output is off
-        TSL.write('POW:STAT 1')  # Turn on output
-        while int(TSL.query('*OPC?')) == 0:  # Wait for operation to complete
-            time.sleep(1)
-
-    TSL.write('POW:UNIT 0')  # Set power unit to dBm
-    TSL.write('WAV:UNIT 0')  # Set wavelength unit to nm
-    TSL.write('COHCtrl 0')  # Disable coherence control
-    TSL.write('POW:ATT:AUT 0')  # Disable automatic attenuation
-    TSL.write('POW:ATT 0')  # Set attenuator value to 0
-    TSL.write('AM:STAT 0')  # Disable amplitude modulation
-    TSL.write('PW:SHUT 0')  # Open internal shutter
-
-    TSL.write(':TRIG:OUTP 3')  # Set trigger output to step mode
-    TSL.write('TRIG:INP:EXT 0')  # Disable external trigger
-
-    # Configure sweep parameters
-    TSL.write(f'POW {power}')  # Set output power
-    TSL.write(f'WAV:SWE:STAR {start_wavelength}')  # Set start wavelength
-    TSL.write(f'WAV:SWE:STOP {stop_wavelength}')  # Set stop wavelength
-    TSL.write(f'WAV:SWE:SPE {speed}')  # Set sweep speed
-    # step_size = float(speed) / 20000
-    TSL.write(f'TRIG:OUTP:STEP {step_size}')  # Set trigger step size
+        TSL.write('POW:STAT 1;*WAI')  # Turn on output, holding further commands until done
+        timeout = TSL.timeout
+        TSL.timeout = max(timeout, 60000)  # Allow for the laser diode warm-up
+        try:
+            TSL.query('*OPC?')  # Returns once the operation is complete
+        finally:
+            TSL.timeout = timeout
+
+    # Units, trigger and sweep parameters in a single write
+    TSL.write(';'.join([
+        'POW:UNIT 0',  # Set power unit to dBm
+        'WAV:UNIT 0',  # Set wavelength unit to nm
+        'COHCtrl 0',  # Disable coherence control
+        'POW:ATT:AUT 0',  # Disable automatic attenuation
+        'POW:ATT 0',  # Set attenuator value to 0
+        'AM:STAT 0',  # Disable amplitude modulation
+        'PW:SHUT 0',  # Open internal shutter
+        ':TRIG:OUTP 3',  # Set trigger output to step mode
+        'TRIG:INP:EXT 0',  # Disable external trigger
+        f'POW {power}',  # Set output power
+        f'WAV:SWE:STAR {start_wavelength}',  # Set start wavelength
+        f'WAV:SWE:STOP {stop_wavelength}',  # Set stop wavelength
+        f'WAV:SWE:SPE {speed}',  # Set sweep speed
+        f'TRIG:OUTP:STEP {step_size}',  # Set trigger step size
+    ]))
 
 
 def configure_PD(start_wavelength, stop_wavelength, speed, step_size):
     """Configures the PD instrument with the given parameters."""
-    step_size = float(speed) / 20000  # Calculate step size based on speed
-
     # Insert the commands of the respective operatio
     PD.write('')  # Set measurement unit to dBm
     PD.write('')  # Set TIA gain level
@@ -92,7 +106,17 @@ def perform_sweep(start_wavelength):
     # Start measurement on PD
     PD.write('')        # Start PD measuring
 
-    TSL.write(':WAV:SWE 1')  # Start sweep
+    # Let the TSL raise a GPIB service request on operation complete (*ESE 1 -> ESB, *SRE 32)
+    TSL.write('*CLS;*ESE 1;*SRE 32')
+    TSL.enable_event(constants.EventType.service_request, constants.EventMechanism.queue)
+    try:
+        TSL.write(':WAV:SWE 1;*OPC')  # Start sweep
+        TSL.wait_on_event(constants.EventType.service_request, 60000)  # Block until the TSL signals completion
+    finally:
+        TSL.disable_event(constants.EventType.service_request, constants.EventMechanism.queue)
+    TSL.read_stb()  # Clear the service request
+
+    # Confirm the sweep is waiting for the trigger (normally already true)
     status = int(TSL.query(':WAV:SWE?'))
     while status != 3:
         # tsl.write(':WAV:SWE 1')
@@ -101,7 +125,7 @@ def perform_sweep(start_wavelength):
     TSL.write(':WAV:SWE:SOFT')
 
     # Wait for PD measurement to complete
-    while PD.query("").split(',')[0] == '0':
+    while PD.query("")[0] == '0':  # Only the first character of the status response is checked
         time.sleep(0.1)
 
     print("SME process done.")
@@ -109,13 +133,24 @@ def perform_sweep(start_wavelength):
 
 def fetch_data():
     """Fetches and returns logged data from the PD."""
+    # NumPy is only imported here, so the configuration and sweep steps do not pay its import time
+    import numpy as np
+
     try:
         # Prompt user for module and channel numbers
         user_input = input("Enter the module and channel number to fetch data from (e.g., 0,1): ")
         module_no, channel_no = map(int, user_input.split(','))
 
         # Query PD for logged data
-        data = PD.query_binary_values(f"")  # Insert the command of the PD to fetch the measurement data
+        # Insert the command of the PD to fetch the measurement data.
+        # The values are returned as a float32 NumPy array rather than a list of Python floats.
+        # The read termination is cleared for the transfer, so the binary block is not scanned for it.
+        read_termination = PD.read_termination
+        PD.read_termination = None
+        try:
+            data = PD.query_binary_values(f"", datatype='f', container=np.ndarray)
+        finally:
+            PD.read_termination = read_termination
         return data
 
     except Exception as e:
@@ -137,7 +172,7 @@ def main():
     start_wavelength = input("Input start wavelength: ")
     stop_wavelength = input("Input stop wavelength: ")
     speed = input("Input scan speed: ")
-    step = float(input("Input step wavelength: "))
+    step = float(input("Input step wavelength: "))  # Shared by the TSL trigger and the PD sampling
 
     # Configure instruments
     configure_tsl(power, start_wavelength, stop_wavelength, speed, step)
@@ -2,13 +2,14 @@
 Script to retrieve TSL power data via GPIB communication using PyVISA.
 """
 
-import math
+import os
+import sys
 import time
-import pyvisa
 from tqdm import tqdm  # For displaying a progress bar during binary data transfer
 
-# Initialize the VISA resource manager
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
 # Define the GPIB address of the TSL instrument
 gpib_resource = "GPIB0::3::INSTR"
@@ -24,12 +25,12 @@ print("IDN: ", idn)
 count = int(tsl.query('READout:POINts?'))
 print("LOGGING POINTS: ", count)
 
-# Estimate the expected size of the binary data transfer:
+# Exact size of the binary data transfer:
 # - Each data point is 4 bytes (typically 32-bit integer or float)
-# - +2 bytes for IEEE block header start (e.g., '#')
-# - +1 byte for separator (optional)
-# - +log10(count) for number of digits in the block length specifier
-expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
+# - IEEE block header '#<n><length>' = 2 bytes + digits of the payload length
+# - +1 byte for the read termination character
+payload_size = count * 4
+expected_size = payload_size + 2 + len(str(payload_size)) + 1
 
 # Progress bar for monitoring data transfer
 with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
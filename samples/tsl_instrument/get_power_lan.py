@@ -2,13 +2,14 @@
 Script to retrieve TSL power data via LAN communication using PyVISA.
 """
 
-import math
-import pyvisa
+import os
+import sys
 from pyvisa import util  # For parsing IEEE 488.2 binary block data
 from tqdm import tqdm  # For showing a progress bar during data transfer
 
-# Create a VISA resource manager to manage instrument communication
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
 # Define the LAN socket address of the TSL instrument (IP address and port)
 lan_resource = "TCPIP0::192.168.1.101::5000::SOCKET"
@@ -25,23 +26,23 @@ print("IDN: ", idn)
 count = int(tsl.query('READout:POINts?'))
 print("LOGGING POINTS: ", count)
 
-# Estimate the expected size of the binary response:
-# - 4 bytes per data point
-# - +2 for the IEEE block header ("#n")
-# - +1 for possible delimiter or header character
-# - +log10(count) for digit count in the data length
-expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
+# Send the command to retrieve the binary power data
+tsl.write(':READout:DATa:POWer?')
+
+# Parse the IEEE 488.2 block header ("#<n><length>") for the exact payload size
+digits = int(tsl.read_bytes(2)[1:])
+length = int(tsl.read_bytes(digits))
 
 # Create a progress bar for monitoring the binary read
-with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
-    # Send the command to retrieve the binary power data
-    tsl.write(':READout:DATa:POWer?')
+with tqdm(total=length, unit='B', unit_scale=True) as progress:
+    # Read the raw binary payload from the instrument
+    payload = tsl.read_bytes(count=length, monitoring_interface=progress)
 
-    # Read the raw binary block from the instrument
-    response = tsl.read_bytes(count=expected_size, monitoring_interface=progress)
+# Consume the trailing read termination character
+tsl.read_bytes(1)
 
-# Decode the IEEE 488.2 binary block into a list of numerical values
-data = util.from_ieee_block(response)
+# Decode the binary payload into a list of numerical values
+data = util.from_binary_block(payload)
 
 # Print the number of power values received
 print(len(data))
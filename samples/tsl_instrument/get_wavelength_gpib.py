@@ -2,12 +2,13 @@
 Script to retrieve TSL wavelength data via GPIB communication using PyVISA.
 """
 
-import math
-import pyvisa
+import os
+import sys
 from tqdm import tqdm  # For progress display during data transfer
 
-# Create a VISA resource manager
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
 # Define the GPIB resource address of the TSL instrument
 gpib_resource = "GPIB0::3::INSTR"
@@ -23,12 +24,12 @@ print("IDN: ", idn)
 count = int(tsl.query('READout:POINts?'))
 print("LOGGING POINTS: ", count)
 
-# Estimate the size of the incoming IEEE 488.2 binary block:
+# Exact size of the incoming IEEE 488.2 binary block:
 # - 4 bytes per data point
-# - 2 bytes for the block header start
-# - 1 byte for separator (optional)
-# - digits for the length specifier (log10(count))
-expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
+# - header '#<n><length>' = 2 bytes + digits of the payload length
+# - 1 byte for the read termination character
+payload_size = count * 4
+expected_size = payload_size + 2 + len(str(payload_size)) + 1
 
 # Read the binary data with a progress bar
 with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
@@ -2,13 +2,14 @@
 Script to retrieve TSL wavelength data via LAN communication using PyVISA.
 """
 
-import math
-import pyvisa
+import os
+import sys
 from pyvisa import util  # For decoding IEEE 488.2 binary blocks
 from tqdm import tqdm  # Progress bar during data transfer
 
-# Initialize VISA resource manager
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
 # Define LAN socket resource for TSL (update IP and port if needed)
 lan_resource = "TCPIP0::192.168.1.152::5000::SOCKET"
@@ -26,23 +27,23 @@ print("IDN: ", idn)
 count = int(tsl.query(':READout:POINts?'))
 print("LOGGING POINTS: ", count)
 
-# Estimate the expected byte size of the binary response:
-# - Each point = 4 bytes (assuming 32-bit integers)
-# - 2 bytes for IEEE header ('#n')
-# - 1 byte for separator
-# - log10(count) = digits in byte count of the payload
-expected_size = count * 4 + (2 + 1 + int(math.log10(count)))
+# Send query command for wavelength data
+tsl.write(':READout:DATa?')
+
+# Parse the IEEE 488.2 block header ('#<n><length>') for the exact payload size
+digits = int(tsl.read_bytes(2)[1:])
+length = int(tsl.read_bytes(digits))
 
 # Begin data transfer with a visual progress bar
-with tqdm(total=expected_size, unit='B', unit_scale=True) as progress:
-    # Send query command for wavelength data
-    tsl.write(':READout:DATa?')
+with tqdm(total=length, unit='B', unit_scale=True) as progress:
+    # Read the raw binary payload from the device
+    payload = tsl.read_bytes(count=length, monitoring_interface=progress)
 
-    # Read the raw binary block from the device
-    response = tsl.read_bytes(count=expected_size, monitoring_interface=progress)
+# Consume the trailing read termination character
+tsl.read_bytes(1)
 
-# Decode the IEEE 488.2 binary block into a list of integers
-data = util.from_ieee_block(response, datatype='i')  # 'i' = signed 32-bit integer
+# Decode the binary payload into a list of integers
+data = util.from_binary_block(payload, datatype='i')  # 'i' = signed 32-bit integer
 # Print the number of data points received
 print("Number of data points received:", len(data))
 
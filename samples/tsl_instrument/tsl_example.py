@@ -1,14 +1,14 @@
+import os
+import sys
 from tsl_instrument import TSL
-import pyvisa
 
-# Initialize PyVISA resource manager
-rm = pyvisa.ResourceManager()
+# The shared helpers (_rm.py) live in the parent samples directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _rm import RM as rm  # Shared PyVISA resource manager
 
-# Open a connection to the TSL instrument via GPIB
-instrument = rm.open_resource('GPIB0::10::INSTR')        # Replace with your instrument's GPIB address
-
-# Create a connection of the TSL class
-tsl = TSL(instrument)
-
-# Print the instrument identification
-print(tsl.get_idn())
+# Open a connection to the TSL instrument via GPIB, closed when the block ends
+with rm.open_resource('GPIB0::10::INSTR') as instrument:        # Replace with your instrument's GPIB address
+    # Create a connection of the TSL class; its worker thread is stopped when the inner block ends
+    with TSL(instrument) as tsl:
+        # Print the instrument identification
+        print(tsl.get_idn())
@@ -6,18 +6,178 @@ Communication: GPIB | LAN (PyVISA)
 Last Updated: Tue Feb 04, 2025 11:00
 """
 
+import asyncio
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 
+import numpy as np
+
+# Response descriptions of the coded settings, shared by the getters
+_POWER_CONTROL_MODES = {
+    '0': "Manual mode",
+    '1': "Auto mode"
+}
+
+_SHUTTER_STATUSES = {
+    '0': "Shutter Open",
+    '1': "Shutter Close"
+}
+
+_POWER_UNITS = {
+    '0': "dBm",
+    '1': "mW"
+}
+
+_SWEEP_MODES = {
+    0: "Step sweep mode and One way",
+    1: "Continuous sweep mode and One way",
+    2: "Step sweep mode and Two way",
+    3: "Continuous sweep mode and Two way"
+}
+
+_SWEEP_STATUSES = {
+    '0': "Stopped",
+    '1': "Running",
+    '3': "Standing by trigger",
+    '4': "Preparation for sweep start"
+}
+
+_MODULATION_STATUSES = {
+    '0': "Disable",
+    '1': "Enable"
+}
+
+_MODULATION_SOURCES = {
+    '0': "Coherence control",
+    '1': "Intensity modulation",
+    '3': "Frequency modulation"
+}
+
+_INPUT_TRIGGER_SETTINGS = {
+    '0': "Disable",
+    '1': "Enable"
+}
+
+_TRIGGER_POLARITIES = {
+    '0': "High Active / Triggers at rising edge",
+    '1': "Low Active / Triggers at falling edge"
+}
+
+_TRIGGER_INPUT_MODES = {
+    '0': "Normal operation mode",
+    '1': "Trigger standby mode"
+}
+
+_OUTPUT_TRIGGER_TIMINGS = {
+    '0': "None",
+    '1': "Stop",
+    '2': "Start",
+    '3': "Step"
+}
+
+_OUTPUT_TRIGGER_PERIOD_MODES = {
+    '0': "Output trigger is periodic in wavelength.",
+    '1': "Output trigger is periodic in time."
+}
+
 
 class TSL:
-    def __init__(self, connection):
+    # Command formats of the sweep setup setters, built once instead of an f-string per call.
+    # The integer and fixed-precision ones are bytes, sent without encoding through write_raw.
+    _CMD_WAV = ':WAV {}'.format
+    _CMD_FREQ = ':FREQ {}'.format
+    _CMD_FINE_TUNING = b':WAV:FIN %.2f'.__mod__
+    _CMD_POW = ':POW {}'.format
+    _CMD_WAV_START = ':WAV:SWE:STAR {}'.format
+    _CMD_FREQ_START = ':FREQ:SWE:STAR {}'.format
+    _CMD_WAV_STOP = ':WAV:SWE:STOP {}'.format
+    _CMD_FREQ_STOP = ':FREQ:SWE:STOP {}'.format
+    _CMD_SWEEP_MODE = b':WAV:SWE:MOD %d'.__mod__
+    _CMD_SWEEP_SPEED = ':WAV:SWE:SPE {}'.format
+    _CMD_WAV_STEP = ':WAV:SWE:STEP {}'.format
+    _CMD_FREQ_STEP = ':FREQ:SWE:STEP {}'.format
+    _CMD_SWEEP_DWELL = ':WAV:SWE:DWEL {}'.format
+    _CMD_SWEEP_CYCLES = b':WAV:SWE:CYCL %d'.__mod__
+    _CMD_SWEEP_DELAY = ':WAV:SWE:DEL {}'.format
+    _CMD_SWEEP_STATUS = b':WAV:SWE %d'.__mod__
+    _CMD_OUTPUT_TRIGGER = b':TRIG:OUTP %d'.__mod__
+    _CMD_TRIGGER_STEP = ':TRIG:OUTP:STEP {}'.format
+
+    def __init__(self, connection, chunk_size: int = 1 << 20):
         """
         Initializes the TSL class with an opened PyVISA resource.
 
         Parameters:
             connection: An open PyVISA resource representing the connected instrument.
+            chunk_size (int): Size of the low-level VISA reads in bytes, 1 MB by default
+                instead of PyVISA's 20 kB, so long responses take few read calls.
         """
         self.connection = connection
+        self.set_chunk_size(chunk_size)
+
+        # A raw socket avoids the VXI-11 RPC round trips of a TCPIP INSTR session
+        resource_name = getattr(connection, 'resource_name', '')
+        if (resource_name.startswith('TCPIP') and resource_name.endswith('::INSTR')
+                and 'hislip' not in resource_name.lower()):
+            warnings.warn(f"{resource_name} is a VXI-11 session; a TCPIP SOCKET session "
+                          f"(e.g. TSL.open_socket) is much faster.", stacklevel=2)
+        elif resource_name.endswith('::SOCKET') and connection.read_termination is None:
+            connection.read_termination = '\r'  # The TSL ends its LAN responses with CR
+
+        # Responses of read-mostly settings (wavelength and power units, command set, GPIB delimiter),
+        # cleared on *RST; a setter drops only its own entry
+        self._cache = {}
+        # Commands collected by batch(), or None when writes are sent immediately
+        self._batch = None
+        # Worker thread of the coroutine methods; one operation at a time per instrument
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @classmethod
+    def open_socket(cls, resource_manager, ip_address: str, port: int = 5000, **kwargs):
+        """
+        Opens the TSL over a raw TCPIP SOCKET session, the fastest LAN connection.
+
+        Parameters:
+            resource_manager: The PyVISA resource manager.
+            ip_address (str): The IP address of the TSL.
+            port (int): The LAN port of the TSL, 5000 by default.
+            kwargs: Keyword arguments passed to the TSL class.
+        """
+        connection = resource_manager.open_resource(f"TCPIP::{ip_address}::{port}::SOCKET", read_termination='\r')
+        return cls(connection, **kwargs)
+
+    def close(self):
+        """
+        Stops the worker thread of the coroutine methods, once their pending queries are done.
+        The PyVISA resource is left open, it is closed by its owner.
+        """
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def _is_thz(self):
+        """
+        True when the wavelength unit is THz. The unit is queried on first use and cached,
+        so the wavelength getters and setters choose their command without a query;
+        *RST drops the cached unit and set_wavelength_unit replaces it.
+        """
+        return self.get_wavelength_unit() == 'THz'
+
+    def set_chunk_size(self, size: int):
+        """
+        Sets the size of the low-level VISA reads.
+
+        Parameters:
+            size (int): Chunk size in bytes.
+        """
+        self.connection.chunk_size = size
 
     def query(self, command):
         """
@@ -31,14 +191,121 @@ class TSL:
         """
         return self.connection.query(command)
 
+    def _query_float(self, command):
+        """
+        Queries a short numeric response and parses it from the raw bytes,
+        skipping the str decoding and termination handling of query.
+        """
+        self.connection.write(command)
+        return float(self.connection.read_raw(64).rstrip(b'\r\n'))
+
+    def _query_int(self, command):
+        """Same as _query_float for integer responses."""
+        self.connection.write(command)
+        return int(self.connection.read_raw(64).rstrip(b'\r\n'))
+
+    async def query_async(self, command):
+        """
+        Coroutine version of query. The blocking VISA query runs in this instrument's worker thread,
+        so several instruments can be queried concurrently from one event loop, while the
+        operations of one instrument still run one after another.
+
+        Parameters:
+            command (str): The command to query the instrument.
+
+        Returns:
+            str: The response from the instrument.
+        """
+        return await self._run_async(self.query, command)
+
+    def _run_async(self, method, *args):
+        """Runs a blocking method in this instrument's worker thread and returns an awaitable of its result."""
+        return asyncio.wrap_future(self._executor.submit(method, *args))
+
     def write(self, command):
         """
         Sends a write command to the instrument.
 
         Parameters:
-            command (str): The command to send to the instrument.
+            command (str | bytes): The command to send to the instrument. A bytes command is sent
+                with write_raw and the resource's current write termination, skipping PyVISA's encoding step.
+        """
+        if isinstance(command, bytes):
+            if b'*RST' in command.upper():
+                self._cache.clear()
+            if self._batch is not None:
+                self._batch.append(command.decode('ascii'))
+            else:
+                self.connection.write_raw(command + (self.connection.write_termination or '').encode('ascii'))
+            return
+        if '*RST' in command.upper():
+            self._cache.clear()
+        if self._batch is not None:
+            self._batch.append(command)
+        else:
+            self.connection.write(command)
+
+    def write_opc(self, command):
         """
-        self.connection.write(command)
+        Sends a write command followed by *OPC? in the same message, so the write and
+        its completion check take a single round trip.
+
+        Parameters:
+            command (str | bytes): The command to send to the instrument.
+
+        Returns:
+            bool: True once the instrument reports the operation as completed.
+        """
+        if isinstance(command, bytes):
+            command = command.decode('ascii')
+        if '*RST' in command.upper():
+            self._cache.clear()
+        return self.query(f'{command};*OPC?') == '1'
+
+    @contextmanager
+    def batch(self):
+        """
+        Collects the write commands issued inside the block and sends them as a single
+        ';'-concatenated write when the block ends. Queries are still sent immediately.
+        Nothing is sent if the block raises an exception; the cached settings recorded inside
+        the block (e.g. by set_wavelength_unit) are then discarded, as they are if the write fails.
+
+        Example:
+            with tsl.batch():
+                tsl.set_sweep_mode(1)
+                tsl.set_sweep_speed(50)
+                tsl.set_sweep_cycles(1)
+            Sends: :WAV:SWE:MOD 1;:WAV:SWE:SPE 50;:WAV:SWE:CYCL 1
+        """
+        self._batch = commands = []
+        cache = self._cache.copy()
+        try:
+            yield self
+            self._batch = None
+            if commands:
+                self.connection.write(';'.join(commands))
+        except BaseException:
+            # The commands did not reach the instrument, restore the cache from before the block
+            self._cache.clear()
+            self._cache.update(cache)
+            raise
+        finally:
+            self._batch = None
+
+    def cached_query(self, command):
+        """
+        Queries the instrument once and returns the stored response on later calls.
+        Only for settings changed through this class; the cache is cleared by '*RST'.
+
+        Parameters:
+            command (str): The command to query the instrument.
+
+        Returns:
+            str: The response from the instrument.
+        """
+        if command not in self._cache:
+            self._cache[command] = self.query(command)
+        return self._cache[command]
 
     def get_idn(self) -> str:
         """
@@ -49,15 +316,21 @@ class TSL:
         """
         return self.query('*IDN?')
 
-    def device_reset(self):
+    def device_reset(self, wait: bool = False):
         """
         Device Reset
         Aborts standby operation.
         Clears the following items.
         ・Command input queue
         ・Error queue
+
+        Parameter
+            wait: True to return only once the reset is completed (*OPC?).
         """
-        self.write('*RST')
+        if wait:
+            self.write_opc('*RST')
+        else:
+            self.write('*RST')
 
     def get_self_test_query(self):
         """
@@ -90,7 +363,7 @@ class TSL:
 
     def get_standard_event_enable_register(self):
         """Gets the Standard Event Enable Register (SEER)."""
-        return int(self.query('*ESE?'))
+        return self._query_int('*ESE?')
 
     def set_standard_event_enable_register(self, value: int):
         """
@@ -102,11 +375,11 @@ class TSL:
 
     def get_standard_event_status_register(self):
         """Gets the Standard Event Status Register (SESR)."""
-        return int(self.query('*ESR?'))
+        return self._query_int('*ESR?')
 
     def get_service_request_enable_register(self):
         """Gets the Service Request Enable Register (SRER)."""
-        return int(self.query('*SRE?'))
+        return self._query_int('*SRE?')
 
     def set_service_request_enable_register(self, value: int):
         """
@@ -115,15 +388,15 @@ class TSL:
 
         Parameter: Setting value from 0 to 255
         """
-        self.query(f'*SRE {value}')
+        self.write(f'*SRE {value}')
 
     def get_status_byte_register(self):
         """Gets the Status Byte Register (STBR)"""
-        return int(self.query('*STB?'))
+        return self._query_int('*STB?')
 
     def get_wavelength_unit(self):
         """Gets wavelength unit."""
-        response = self.query(':WAV:UNIT?')
+        response = self.cached_query(':WAV:UNIT?')
         return "nm" if '0' in response else "THz" if '1' in response else ""
 
     def set_wavelength_unit(self, unit: int):
@@ -136,24 +409,27 @@ class TSL:
                 1: THz
         """
         self.write(f':WAV:UNIT {unit}')
+        # Record the new unit, also valid inside batch() before the write is sent;
+        # batch() restores the previous entry if its write is never sent
+        self._cache[':WAV:UNIT?'] = str(unit)
 
     def get_wavelength(self):
         """Gets the wavelength value."""
-        if self.get_wavelength_unit() == 'THz':
+        if self._is_thz:
             return self.query(':FREQ?')
         else:
             return self.query(':WAV?')
 
     def set_wavelength(self, value):
         """Sets the output wavelength."""
-        if self.get_wavelength_unit() == 'THz':
-            self.write(f':FREQ {value}')
+        if self._is_thz:
+            self.write(self._CMD_FREQ(value))
         else:
-            self.write(f':WAV {value}')
+            self.write(self._CMD_WAV(value))
 
     def get_fine_tuning(self):
         """Reads out Fine-Tuning value."""
-        return float(self.query(':WAV:FIN?'))
+        return self._query_float(':WAV:FIN?')
 
     def set_fine_tuning(self, value: float):
         """
@@ -163,11 +439,11 @@ class TSL:
             Range: -100.00 to +100.00
             Step: 0.01
         """
-        self.write(f':WAV:FIN {value}')
+        self.write(self._CMD_FINE_TUNING(value))
 
     def disable_fine_tuning(self):
         """Terminates Fine-Tuning operation."""
-        self.query(':WAV:FIN:DIS')
+        self.write(':WAV:FIN:DIS')
 
     def get_coherence_control(self):
         """Reads out Coherence control status."""
@@ -189,20 +465,24 @@ class TSL:
         response = self.query(':POW:STAT?')
         return "OFF" if response == '0' else "ON" if response == '1' else ""
 
-    def set_optical_output_status(self, value: int):
+    def set_optical_output_status(self, value: int, wait: bool = False):
         """
         Sets optical output status.
 
         Parameter
             0: Optical output OFF
             1: Optical output ON
+            wait: True to return only once the output has settled (*OPC?).
+                The laser diode warm-up may need a longer session timeout.
         """
-        self.write(f':POW:STAT {value}')
+        if wait:
+            self.write_opc(f':POW:STAT {value}')
+        else:
+            self.write(f':POW:STAT {value}')
 
     def get_attenuator(self):
         """Reads out the attenuator value."""
-        response = self.query(':POW:ATT?')
-        return float(response)
+        return self._query_float(':POW:ATT?')
 
     def set_attenuator(self, value: float):
         """
@@ -217,11 +497,7 @@ class TSL:
     def get_power_control_mode(self):
         """Reads out the setting of the power control."""
         response = self.query(':POW:ATT:AUT?')
-        power_modes = {
-            '0': "Manual mode",
-            '1': "Auto mode"
-        }
-        return power_modes.get(response, "Unknown mode")
+        return _POWER_CONTROL_MODES.get(response, "Unknown mode")
 
     def set_power_control_mode(self, value: int):
         """
@@ -235,8 +511,7 @@ class TSL:
 
     def get_power(self):
         """Reads out optical output power level setting."""
-        response = self.query(':POW?')
-        return float(response)
+        return self._query_float(':POW?')
 
     def set_power(self, power: float):
         """
@@ -254,7 +529,7 @@ class TSL:
         When a unit character string is not specified, the default units are used.
         The default units are defined by the command “:POWer:UNIT”.
         """
-        self.write(f':POW {power}')
+        self.write(self._CMD_POW(power))
 
     def power_monitor(self):
         """
@@ -266,16 +541,28 @@ class TSL:
             Step: 0.01dB (0.01mW)
             Units are defined by the command “:POWer:UNIT”.
         """
-        return float(self.query(':POW:ACT?'))
+        return self._query_float(':POW:ACT?')
+
+    def get_wavelength_and_power_monitor(self):
+        """
+        Reads out the output wavelength (or frequency, in THz unit) and the monitored optical power
+        with one compound query, for live display loops.
+
+        Returns:
+            tuple: (wavelength, monitored power)
+        """
+        wavelength_command = ':FREQ?' if self._is_thz else ':WAV?'
+        wavelength, power = self.query(f'{wavelength_command};:POW:ACT?').split(';')
+        return float(wavelength), float(power)
+
+    async def power_monitor_async(self):
+        """Coroutine version of power_monitor, for polling loops."""
+        return await self._run_async(self.power_monitor)
 
     def get_internal_shutter_status(self):
         """Reads out the status of the internal shutter."""
         response = self.query(':POW:SHUT?')
-        shutter_status = {
-            '0': "Shutter Open",
-            '1': "Shutter Close"
-        }
-        return shutter_status.get(response, "Unknown status")
+        return _SHUTTER_STATUSES.get(response, "Unknown status")
 
     def set_internal_shutter_status(self, value: int):
         """
@@ -291,12 +578,8 @@ class TSL:
 
     def get_power_unit(self):
         """Reads out the unit of the power setting and display."""
-        response = self.query(':POW:UNIT?')
-        units = {
-            '0': "dBm",
-            '1': "mW"
-        }
-        return units.get(response, "Unknown unit")
+        response = self.cached_query(':POW:UNIT?')
+        return _POWER_UNITS.get(response, "Unknown unit")
 
     def set_power_unit(self, unit: int):
         """
@@ -306,11 +589,12 @@ class TSL:
             0: dBm
             1: mW
         """
+        self._cache.pop(':POW:UNIT?', None)
         self.write(f':POW:UNIT {unit}')
 
     def get_start_wavelength(self):
         """Reads out the sweep start wavelength."""
-        if self.get_wavelength_unit() == 'THz':
+        if self._is_thz:
             return self.query(':FREQ:SWE:STAR?')
         else:
             return self.query(':WAV:SWE:STAR?')
@@ -344,17 +628,17 @@ class TSL:
             representing a unit. When a unit character string is not
             specified, Hz（Hertz）is used as the default.
         """
-        if not self.minimum_sweep_wavelength <= value <= self.maximum_sweep_wavelength:
+        if not self.minimum_sweep_wavelength() <= value <= self.maximum_sweep_wavelength():
             raise Exception(f"Value {value} out of range.")
 
-        if self.get_wavelength_unit() == 'THz':
-            self.write(f':FREQ:SWE:STAR {value}')
+        if self._is_thz:
+            self.write(self._CMD_FREQ_START(value))
         else:
-            self.write(f':WAV:SWE:STAR {value}')
+            self.write(self._CMD_WAV_START(value))
 
     def get_stop_wavelength(self):
         """Reads out the sweep stop wavelength."""
-        if self.get_wavelength_unit() == 'THz':
+        if self._is_thz:
             return self.query(':FREQ:SWE:STOP?')
         else:
             return self.query(':WAV:SWE:STOP?')
@@ -388,38 +672,32 @@ class TSL:
             representing a unit. When a unit character string is not
             specified, Hz（Hertz）is used as the default.
         """
-        if not self.minimum_sweep_wavelength <= value <= self.maximum_sweep_wavelength:
+        if not self.minimum_sweep_wavelength() <= value <= self.maximum_sweep_wavelength():
             raise Exception(f"Value {value} out of range.")
 
-        if self.get_wavelength_unit() == 'THz':
-            self.write(f':FREQ:SWE:STOP {value}')
+        if self._is_thz:
+            self.write(self._CMD_FREQ_STOP(value))
         else:
-            self.write(f':WAV:SWE:STOP {value}')
+            self.write(self._CMD_WAV_STOP(value))
 
     def minimum_sweep_wavelength(self):
         """Reads out the minimum wavelength in the configurable sweep range."""
-        if self.wavelength_unit == 'THz':
-            return float(self.query(':FREQ:SWE:RANG:MIN?'))
+        if self._is_thz:
+            return self._query_float(':FREQ:SWE:RANG:MIN?')
         else:
-            return float(self.query(':WAV:SWE:RANG:MIN?'))
+            return self._query_float(':WAV:SWE:RANG:MIN?')
 
     def maximum_sweep_wavelength(self):
         """Reads out the maximum wavelength in the configurable sweep range."""
-        if self.wavelength_unit == 'THz':
-            return float(self.query(':FREQ:SWE:RANG:MAX?'))
+        if self._is_thz:
+            return self._query_float(':FREQ:SWE:RANG:MAX?')
         else:
-            return float(self.query(':WAV:SWE:RANG:MAX?'))
+            return self._query_float(':WAV:SWE:RANG:MAX?')
 
     def get_sweep_mode(self):
         """Reads out the sweep mode."""
-        response = int(self.query(':WAV:SWE:MOD?'))
-        modes = {
-            0: "Step sweep mode and One way",
-            1: "Continuous sweep mode and One way",
-            2: "Step sweep mode and Two way",
-            3: "Continuous sweep mode and Two way"
-        }
-        return modes.get(response, "Unknown mode")
+        response = self._query_int(':WAV:SWE:MOD?')
+        return _SWEEP_MODES.get(response, "Unknown mode")
 
     def set_sweep_mode(self, mode: int):
         """
@@ -431,11 +709,11 @@ class TSL:
             2: Step sweep mode and Two way
             3: Continuous sweep mode and Two way
         """
-        self.write(f':WAV:SWE:MOD {mode}')
+        self.write(self._CMD_SWEEP_MODE(mode))
 
     def get_sweep_speed(self):
         """Reads out sweep speed."""
-        return float(self.query(':WAV:SWE:SPE?'))
+        return self._query_float(':WAV:SWE:SPE?')
 
     def set_sweep_speed(self, speed: int):
         """
@@ -450,14 +728,14 @@ class TSL:
             SCPI <value> should be decimal notation in “nm/s”
             Character strings representing a unit cannot be accepted.
         """
-        self.write(f':WAV:SWE:SPE {speed}')
+        self.write(self._CMD_SWEEP_SPEED(speed))
 
     def get_step_width(self):
         """Reads out the step of Step sweep mode."""
-        if self.get_wavelength_unit() == 'THz':
+        if self._is_thz:
             return self.query(':FREQ:SWE:STEP?')
         else:
-            return float(self.query(':WAV:SWE:STEP?'))
+            return self._query_float(':WAV:SWE:STEP?')
 
     def set_step_width(self, step):
         """
@@ -488,14 +766,14 @@ class TSL:
             representing a unit. When a unit character string is not
             specified, “Hz” is used as the default units.
         """
-        if self.get_wavelength_unit() == 'THz':
-            self.write(f':FREQ:SWE:STEP {step}')
+        if self._is_thz:
+            self.write(self._CMD_FREQ_STEP(step))
         else:
-            self.write(f':WAV:SWE:STEP {step}')
+            self.write(self._CMD_WAV_STEP(step))
 
     def get_sweep_dwell(self):
         """Reads out wait time between consequent steps in step sweep mode."""
-        return float(self.query(':WAV:SWE:DWEL?'))
+        return self._query_float(':WAV:SWE:DWEL?')
 
     def set_sweep_dwell(self, value: float):
         """
@@ -506,11 +784,11 @@ class TSL:
             Range: 0 to 999.9 sec
             Step: 0.1 sec
         """
-        self.write(f':WAV:SWE:DWEL {value}')
+        self.write(self._CMD_SWEEP_DWELL(value))
 
     def get_sweep_cycles(self):
         """Reads out the setting sweep repetition times."""
-        return int(self.query(':WAV:SWE:CYCL?'))
+        return self._query_int(':WAV:SWE:CYCL?')
 
     def set_sweep_cycles(self, cycle: int):
         """
@@ -520,15 +798,19 @@ class TSL:
             Range: 0 to 999
             Step: 1
         """
-        self.write(f':WAV:SWE:CYCL {cycle}')
+        self.write(self._CMD_SWEEP_CYCLES(cycle))
 
     def get_sweep_count(self):
         """Reads out the current number of completed sweeps."""
-        return int(self.query(':WAV:SWE:COUN?'))
+        return self._query_int(':WAV:SWE:COUN?')
+
+    async def get_sweep_count_async(self):
+        """Coroutine version of get_sweep_count, for polling loops."""
+        return await self._run_async(self.get_sweep_count)
 
     def get_sweep_delay(self):
         """Reads out the setting wait time between consequent scans."""
-        return float(self.query(':WAV:SWE:DEL?'))
+        return self._query_float(':WAV:SWE:DEL?')
 
     def set_sweep_delay(self, time: float):
         """
@@ -538,20 +820,60 @@ class TSL:
             Range: 0 to 999.9 sec
             Step: 0.1 sec
         """
-        self.write(f':WAV:SWE:DEL {time}')
+        self.write(self._CMD_SWEEP_DELAY(time))
+
+    def get_sweep_configuration(self) -> dict:
+        """
+        Reads out the sweep settings with one compound query, e.g. to log a run.
+
+        Returns:
+            dict: mode, speed, start, stop, step, cycles, delay and trigger_step.
+                start, stop and step are in the current wavelength unit (nm or THz).
+        """
+        prefix = ':FREQ' if self._is_thz else ':WAV'
+        response = self.query(';'.join([
+            ':WAV:SWE:MOD?',
+            ':WAV:SWE:SPE?',
+            f'{prefix}:SWE:STAR?',
+            f'{prefix}:SWE:STOP?',
+            f'{prefix}:SWE:STEP?',
+            ':WAV:SWE:CYCL?',
+            ':WAV:SWE:DEL?',
+            ':TRIG:OUTP:STEP?',
+        ]))
+        mode, speed, start, stop, step, cycles, delay, trigger_step = response.split(';')
+        return {
+            'mode': int(mode),
+            'speed': float(speed),
+            'start': float(start),
+            'stop': float(stop),
+            'step': float(step),
+            'cycles': int(cycles),
+            'delay': float(delay),
+            'trigger_step': float(trigger_step),
+        }
 
     def get_sweep_status(self):
         """Reads out the current sweep status."""
         response = self.query(':WAV:SWE?')
-        statuses = {
-            '0': "Stopped",
-            '1': "Running",
-            '3': "Standing by trigger",
-            '4': "Preparation for sweep start"
-        }
-        return statuses.get(response, "Unknown status")
+        return _SWEEP_STATUSES.get(response, "Unknown status")
 
-    def set_sweep_status(self, status: int):
+    def get_sweep_status_and_count(self):
+        """
+        Reads out the current sweep status and the number of completed sweeps with one compound query,
+        for polling loops.
+
+        Returns:
+            tuple: (sweep status, completed sweep count)
+        """
+        status, count = self.query(':WAV:SWE?;:WAV:SWE:COUN?').split(';')
+        return _SWEEP_STATUSES.get(status.strip(), "Unknown status"), int(count)
+
+    async def get_sweep_status_async(self):
+        """Coroutine version of get_sweep_status, for polling loops."""
+        return await self._run_async(self.get_sweep_status)
+
+    def set_sweep_status(self, status: int, wait: bool = False):
         """
         Sets sweep status.
         This command executes a single scan.
@@ -559,12 +881,16 @@ class TSL:
         Parameter
             0: Stop.
             1: Start.
+            wait: True to return only once the command is completed (*OPC?).
         """
-        self.write(f':WAV:SWE {status}')
+        if wait:
+            self.write_opc(self._CMD_SWEEP_STATUS(status))
+        else:
+            self.write(self._CMD_SWEEP_STATUS(status))
 
-    def start_sweep(self):
+    def start_sweep(self, wait: bool = False):
         """Starts the TSL sweep operation."""
-        self.set_sweep_status(1)
+        self.set_sweep_status(1, wait)
 
     def stop_sweep(self):
         """Stops the TSL sweep operation."""
@@ -572,7 +898,7 @@ class TSL:
 
     def repeat_scan(self):
         """Starts repeat scan."""
-        self.query(':WAV:SWE:REP')
+        self.write(':WAV:SWE:REP')
 
     def get_logging_count(self):
         """
@@ -581,36 +907,45 @@ class TSL:
         Response
             0 to 500,000
         """
-        return int(self.query(':READ:POIN?'))
+        return self._query_int(':READ:POIN?')
+
+    def _query_logging_data(self, command):
+        """
+        Reads a logging data block as a float32 NumPy array.
+
+        The point count is read first, so the array is decoded in one step with a known
+        length and the whole block fits in one low-level read (4 bytes per point plus the header).
+
+        PyVISA decodes the block with np.frombuffer, so the array is a read-only view on the
+        received bytes without a Python float per point; use .copy() for a writable array.
+        """
+        count = self.get_logging_count()
+        return self.connection.query_binary_values(command,
+                                                   datatype='f',
+                                                   is_big_endian=False,
+                                                   container=np.ndarray,
+                                                   data_points=count,
+                                                   expect_termination=False,
+                                                   chunk_size=max(count * 4 + 64, self.connection.chunk_size))
 
     def get_wavelength_logging_data(self):
         """Reads out wavelength logging data."""
         try:
-            return self.connection.query_binary_values('READ:DAT?',
-                                                       datatype='f',
-                                                       is_big_endian=False,
-                                                       expect_termination=False)
+            return self._query_logging_data('READ:DAT?')
         except Exception as e:
             print(f"Error while fetching wavelength logging data (query_binary_values): {e}")
 
     def get_power_logging_data(self):
         """Reads out power logging data."""
         try:
-            return self.connection.query_binary_values(':READ:DAT:POW?',
-                                                       datatype='f',
-                                                       is_big_endian=False,
-                                                       expect_termination=False)
+            return self._query_logging_data(':READ:DAT:POW?')
         except Exception as e:
             print(f"Error while fetching power logging data (query_binary_values): {e}")
 
     def get_modulation_function_status(self):
         """Reads out status of modulation function of the laser output."""
         response = self.query(':AM:STAT?')
-        status = {
-            '0': "Disable",
-            '1': "Enable"
-        }
-        return status.get(response, "Unknown status")
+        return _MODULATION_STATUSES.get(response, "Unknown status")
 
     def set_modulation_function_status(self, value: int):
         """
@@ -625,12 +960,7 @@ class TSL:
     def get_modulation_source(self):
         """Reads out the modulation source."""
         response = self.query(':AM:SOUR?')
-        modulation_sources = {
-            '0': "Coherence control",
-            '1': "Intensity modulation",
-            '3': "Frequency modulation"
-        }
-        return modulation_sources.get(response, "Unknown source")
+        return _MODULATION_SOURCES.get(response, "Unknown source")
 
     def set_modulation_source(self, value: int):
         """
@@ -646,11 +976,7 @@ class TSL:
     def get_input_trigger(self):
         """Reads out the setting of external trigger input."""
         response = self.query(':TRIG:INP:EXT?')
-        trigger_settings = {
-            '0': "Disable",
-            '1': "Enable"
-        }
-        return trigger_settings.get(response, "Unknown setting")
+        return _INPUT_TRIGGER_SETTINGS.get(response, "Unknown setting")
 
     def set_input_trigger(self, value: int):
         """
@@ -665,11 +991,7 @@ class TSL:
     def get_input_trigger_polarity(self):
         """Reads out input trigger polarity."""
         response = self.query(':TRIG:INP:ACT?')
-        polarities = {
-            '0': "High Active / Triggers at rising edge",
-            '1': "Low Active / Triggers at falling edge"
-        }
-        return polarities.get(response, "Unknown polarity")
+        return _TRIGGER_POLARITIES.get(response, "Unknown polarity")
 
     def set_input_trigger_polarity(self, value: int):
         """
@@ -684,11 +1006,7 @@ class TSL:
     def get_trigger_signal_input_mode(self):
         """Reads out the trigger signal input standby mode."""
         response = self.query(':TRIG:INP:STAN?')
-        input_modes = {
-            '0': "Normal operation mode",
-            '1': "Trigger standby mode"
-        }
-        return input_modes.get(response, "Unknown mode")
+        return _TRIGGER_INPUT_MODES.get(response, "Unknown mode")
 
     def set_trigger_signal_input_mode(self, signal: int):
         """
@@ -702,18 +1020,12 @@ class TSL:
 
     def software_trigger(self):
         """Issues a software trigger. Executes sweep from trigger standby mode."""
-        return self.write(':WAV:SWE:SOFT')
+        self.write(':WAV:SWE:SOFT')
 
     def get_output_trigger_signal(self):
         """Reads out the timing setting of the trigger signal output."""
         response = self.query(':TRIG:OUTP?')
-        trigger_states = {
-            '0': "None",
-            '1': "Stop",
-            '2': "Start",
-            '3': "Step"
-        }
-        return trigger_states.get(response, "Unknown state")
+        return _OUTPUT_TRIGGER_TIMINGS.get(response, "Unknown state")
 
     def set_output_trigger_signal(self, signal: int):
         """
@@ -725,16 +1037,12 @@ class TSL:
             2: Start
             3: Step
         """
-        self.write(f':TRIG:OUTP {signal}')
+        self.write(self._CMD_OUTPUT_TRIGGER(signal))
 
     def get_output_trigger_polarity(self):
         """Reads out output trigger polarity."""
         response = self.query(':TRIG:OUTP:ACT?')
-        polarities = {
-            '0': "High Active / Triggers at rising edge",
-            '1': "Low Active / Triggers at falling edge"
-        }
-        return polarities.get(response, "Unknown polarity")
+        return _TRIGGER_POLARITIES.get(response, "Unknown polarity")
 
     def set_output_trigger_polarity(self, value: int):
         """
@@ -748,7 +1056,7 @@ class TSL:
 
     def get_trigger_step(self):
         """Reads out the interval of the trigger signal output."""
-        return float(self.query(':TRIG:OUTP:STEP?'))
+        return self._query_float(':TRIG:OUTP:STEP?')
 
     def set_trigger_step(self, value: float):
         """
@@ -769,16 +1077,12 @@ class TSL:
             representing a unit. When a unit character string is not
             specified, m (meter) is used as the default.
         """
-        self.write(f':TRIG:OUTP:STEP {value}')
+        self.write(self._CMD_TRIGGER_STEP(value))
 
     def get_output_trigger_period_mode(self):
         """Reads out the output trigger period mode."""
         response = self.query(':TRIG:OUTP:SETT?')
-        modes = {
-            '0': "Output trigger is periodic in wavelength.",
-            '1': "Output trigger is periodic in time."
-        }
-        return modes.get(response, "Unknown mode")
+        return _OUTPUT_TRIGGER_PERIOD_MODES.get(response, "Unknown mode")
 
     def set_output_trigger_period_mode(self, value: int):
         """
@@ -809,15 +1113,26 @@ class TSL:
         """
         self.write(f':TRIG:THR {value}')
 
-    # TODO: Rework the Error information method
-    # def get_error_info(self):
-    #     """Reads out the error issued."""
-    #     response = self.query(':SYST:ERR?').split()
-    #     return CommandError[response].value if response in CommandError.__members__ else "Unknown Error"
+    def has_error(self) -> bool:
+        """Returns True when the error queue holds an error (Status Byte bit 2, error/event queue available)."""
+        return bool(self.get_status_byte_register() & 0x04)
+
+    def get_error_info(self):
+        """
+        Reads out the error issued.
+        The error queue is only read when the Status Byte reports an error, so the
+        common no-error case costs one short *STB? query.
+
+        Response: <error code>,<error message>, e.g. 0,"No error"
+        """
+        if not self.has_error():
+            return CommandError.NoError.value
+        code = self.query(':SYST:ERR?').split(',', 1)[0].strip()
+        return _COMMAND_ERROR_DESCRIPTIONS.get(code, "Unknown Error")
 
     def get_gpib_address(self):
         """Reads out the GPIB address."""
-        return int(self.query(':SYST:COMM:GPIB:ADDR?'))
+        return self._query_int(':SYST:COMM:GPIB:ADDR?')
 
     def set_gpib_address(self, value: int):
         """
@@ -830,7 +1145,7 @@ class TSL:
 
     def get_gpib_delimiter(self):
         """Reads out the command delimiter for GPIB communication."""
-        response = self.query(':SYST:COMM:GPIB:DEL?')
+        response = self.cached_query(':SYST:COMM:GPIB:DEL?')
         if response == '0':
             return "CR"
         elif response == '1':
@@ -852,6 +1167,7 @@ class TSL:
             2: CR+LF
             3: None
         """
+        self._cache.pop(':SYST:COMM:GPIB:DEL?', None)
         self.write(f':SYST:COMM:GPIB:DEL {value}')
 
     def get_mac_address(self):
@@ -898,7 +1214,7 @@ class TSL:
 
     def get_port_number(self):
         """Reads out the port number."""
-        return int(self.query(':SYST:COMM:ETH:PORT?'))
+        return self._query_int(':SYST:COMM:ETH:PORT?')
 
     def set_port_number(self, value: int):
         """
@@ -911,7 +1227,7 @@ class TSL:
 
     def get_command_set(self):
         """Reads out the current set."""
-        response = self.query(':SYST:COMM:COD?')
+        response = self.cached_query(':SYST:COMM:COD?')
         if response == '0':
             return "Legacy"
         elif response == '1':
@@ -926,6 +1242,7 @@ class TSL:
             0: Legacy
             1: SCPI
         """
+        self._cache.pop(':SYST:COMM:COD?', None)
         self.write(f':SYST:COMM:COD {value}')
 
     def external_interlock(self):
@@ -945,7 +1262,7 @@ class TSL:
 
     def get_display_brightness(self):
         """Reads out brightness of the display."""
-        return int(self.query(':DISP:BRIG?'))
+        return self._query_int(':DISP:BRIG?')
 
     def set_display_brightness(self, value: int):
         """
@@ -1012,3 +1329,21 @@ class CommandError(Enum):
     ExecutionError = "Execution error"
     DataOutOfRange = "Data out of range"
     QueryInterrupted = "Query INTERRUPTED"
+
+
+# SCPI error codes of the :SYST:ERR? response
+_COMMAND_ERRORS = {
+    '0': CommandError.NoError,
+    '-102': CommandError.SyntaxError,
+    '-103': CommandError.InvalidSeparator,
+    '-108': CommandError.ParameterNotAllowed,
+    '-109': CommandError.MissingParameter,
+    '-113': CommandError.UndefinedHeader,
+    '-148': CommandError.CharacterDataNotAllowed,
+    '-200': CommandError.ExecutionError,
+    '-222': CommandError.DataOutOfRange,
+    '-410': CommandError.QueryInterrupted,
+}
+
+# Error descriptions by code, resolved once so error polling is a single dict lookup
+_COMMAND_ERROR_DESCRIPTIONS = {code: error.value for code, error in _COMMAND_ERRORS.items()}